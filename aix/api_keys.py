@@ -1,14 +1,14 @@
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
-from .config import Config
+from .config import get_config
 
 console = Console()
 
 
 def setup_api_key(provider: str) -> bool:
     """Interactively set up an API key for a provider."""
-    config = Config()
+    config = get_config()
 
     provider_info = {
         "openrouter": {
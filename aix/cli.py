@@ -11,8 +11,7 @@ from datetime import datetime
 
 from .storage import PromptStorage
 from .template import PromptTemplate, TemplateSafeEncoder
-from .config import Config
-from .api_client import get_client
+from .config import get_config
 from .api_keys import setup_api_key
 from .commands.executor import CommandExecutor
 from .commands.security import DefaultSecurityValidator
@@ -250,7 +249,7 @@ def edit(
 ):
     """Edit a prompt template using your preferred editor."""
     storage = PromptStorage()
-    config = Config()
+    config = get_config()
     prompt = storage.get_prompt(name)
 
     if not prompt:
@@ -438,7 +437,7 @@ def run(
 ):
     """Run a prompt with parameter substitution and optional API execution."""
     storage = PromptStorage()
-    config = Config()
+    config = get_config()
     manager = CollectionManager()
 
     # Check if a collection is loaded and if the prompt is in it
@@ -650,7 +649,7 @@ week_number: {current_week}
         if typer.confirm("Would you like to set it up now?"):
             if setup_api_key(selected_provider):
                 # Reload config to get the new API key
-                config = Config()
+                config = get_config()
                 api_key = config.get_api_key(selected_provider)
                 console.print(
                     f"API key for {selected_provider} configured successfully!",
@@ -672,6 +671,9 @@ week_number: {current_week}
         if not api_key:
             console.print("No API key available", style="red")
             return
+        # httpx is only needed once a request is actually made
+        from .api_client import get_client
+
         client = get_client(selected_provider, api_key, config=config)
 
         # Get default model
@@ -830,7 +832,7 @@ def config(
     ),
 ):
     """Manage configuration settings."""
-    config_manager = Config()
+    config_manager = get_config()
 
     # Handle reset option
     if reset:
@@ -942,7 +944,7 @@ def api_key_command(
     ),
 ):
     """Manage API keys for different providers."""
-    config_manager = Config()
+    config_manager = get_config()
 
     if action == "set":
         setup_api_key(provider)
@@ -1111,10 +1113,8 @@ def collection_create(
 
     # Validate that all specified templates exist
     storage = PromptStorage()
-    missing_templates = []
-    for template_name in templates:
-        if not storage.prompt_exists(template_name):
-            missing_templates.append(template_name)
+    existing_templates = storage.list_prompt_names() if templates else set()
+    missing_templates = [name for name in templates if name not in existing_templates]
 
     if missing_templates:
         console.print(
@@ -1590,7 +1590,7 @@ def provider_add(
     console = Console()
 
     try:
-        config = Config()
+        config = get_config()
 
         # Quick mode when both name and base_url are provided
         if name and base_url:
@@ -1788,7 +1788,7 @@ def provider_list():
     console = Console()
 
     try:
-        config = Config()
+        config = get_config()
         providers = config.get_custom_providers()
 
         if not providers:
@@ -1823,7 +1823,7 @@ def provider_info(name: str = typer.Argument(..., help="Provider name")):
     console = Console()
 
     try:
-        config = Config()
+        config = get_config()
         provider_data = config.get_custom_provider(name)
 
         if not provider_data:
@@ -1863,7 +1863,7 @@ def provider_remove(name: str = typer.Argument(..., help="Provider name")):
     console = Console()
 
     try:
-        config = Config()
+        config = get_config()
 
         # Check if provider exists
         if not config.get_custom_provider(name):
@@ -1890,7 +1890,7 @@ def provider_quick_setup():
     console = Console()
 
     try:
-        config = Config()
+        config = get_config()
 
         console.print("⚡ [bold cyan]Quick Provider Setup[/bold cyan]")
         console.print("Choose from common provider configurations:\n")
@@ -1,13 +1,138 @@
 """Collection management for organizing prompt templates."""
 
+import json
 import os
+import re
+import sys
+import uuid
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any, Iterator, Set
 from dataclasses import dataclass, asdict
-from .template import PromptTemplate
+from .template import PlaceholderGenerator, PromptTemplate
 from .storage import PromptStorage
 
+# Buffer sizes for bundle imports: tar stream reads and member copies
+_TAR_BUFSIZE = 256 * 1024
+_COPY_BUFSIZE = 1 << 20
+
+
+def _list_xml_stems(path: Path) -> List[str]:
+    """List the stems of *.xml files in a directory with a single scandir pass."""
+    with os.scandir(path) as entries:
+        return [
+            entry.name[:-4]
+            for entry in entries
+            if entry.name.endswith(".xml") and entry.is_file()
+        ]
+
+
+def _fadvise(fileobj: IO[bytes], advice_name: str) -> None:
+    """Pass an access-pattern hint for an open file to the kernel where supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is not None:
+        try:
+            os.posix_fadvise(fileobj.fileno(), 0, 0, advice)
+        except OSError:
+            pass
+
+
+def _cdata_placeholder(cdata_sections: List[bytes], nonce: str, text: str) -> str:
+    """Queue text as a CDATA section and return the placeholder to put in the tree.
+
+    The per-save nonce keeps user text that looks like a placeholder from being
+    mistaken for one.
+    """
+    # A literal "]]>" would end the section early, so split it across two sections
+    text = text.replace("]]>", "]]]]><![CDATA[>")
+    cdata_sections.append(f"<![CDATA[{text}]]>".encode("utf-8"))
+    return f"__AIX_CDATA_{nonce}_{len(cdata_sections) - 1}__"
+
+
+@lru_cache(maxsize=512)
+def _parse_xml_file(path: str, mtime_ns: int, size: int) -> ET.Element:
+    """Read an XML file in a single call and parse it from bytes.
+
+    The stat signature is part of the cache key so a changed file is re-parsed.
+    Callers must treat the returned tree as read-only.
+    """
+    with open(path, "rb") as f:
+        return ET.fromstring(f.read())
+
+
+def _read_xml_template_index(xml_path: Path) -> Dict[str, ET.Element]:
+    """Map embedded template names to their elements for an XML collection file."""
+    st = os.stat(xml_path)
+    return _index_xml_templates(str(xml_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=512)
+def _index_xml_templates(path: str, mtime_ns: int, size: int) -> Dict[str, ET.Element]:
+    """Index the <template> elements of a parsed file by name, first one winning."""
+    index: Dict[str, ET.Element] = {}
+    for template_elem in _parse_xml_file(path, mtime_ns, size).iterfind(
+        "templates/template"
+    ):
+        name = template_elem.findtext("metadata/name")
+        if name and name not in index:
+            index[name] = template_elem
+    return index
+
+
+def _read_xml_collection_data(xml_path: Path) -> Optional[Dict[str, Any]]:
+    """Read collection metadata and template names from an XML collection file."""
+    st = os.stat(xml_path)
+    return _stream_collection_data(str(xml_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=512)
+def _stream_collection_data(
+    path: str, mtime_ns: int, size: int
+) -> Optional[Dict[str, Any]]:
+    """Stream-parse collection metadata without holding template bodies in memory.
+
+    Each <template> is cleared as soon as its name is read. Returns None if the
+    file is not a collection. The returned dict is shared and must not be mutated.
+    """
+    template_names = []
+    # Only end events are needed; the root is available once parsing finishes
+    events = ET.iterparse(path, events=("end",))
+    for _, elem in events:
+        if elem.tag == "template":
+            name = elem.findtext("metadata/name")
+            if name:
+                template_names.append(name)
+            elem.clear()
+
+    root = events.root
+    if root is None or root.tag != "collection":
+        return None
+
+    metadata = root.find("metadata")
+    if metadata is None:
+        return None
+
+    return {
+        "name": metadata.findtext("name"),
+        "description": metadata.findtext("description", ""),
+        "system_prompt": metadata.findtext("system_prompt"),
+        "author": metadata.findtext("author", ""),
+        "created_at": metadata.findtext("created_at", ""),
+        "updated_at": metadata.findtext("updated_at", ""),
+        "tags": [tag.text for tag in metadata.iterfind("tags/tag") if tag.text],
+        "templates": template_names,
+    }
+
+
+def _clear_xml_caches() -> None:
+    """Drop cached parses after this module writes a collection file."""
+    _parse_xml_file.cache_clear()
+    _index_xml_templates.cache_clear()
+    _stream_collection_data.cache_clear()
+
 
 @dataclass
 class Collection:
@@ -28,6 +153,12 @@ class Collection:
         if self.tags is None:
             self.tags = []
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "templates":
+            # Rebuild the membership index whenever the template list is replaced
+            super().__setattr__("_template_set", set(value or ()))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert collection to dictionary."""
         return asdict(self)
@@ -39,21 +170,23 @@ class Collection:
 
     def add_template(self, template_name: str) -> bool:
         """Add a template to the collection."""
-        if template_name not in self.templates:
+        if template_name not in self._template_set:
             self.templates.append(template_name)
+            self._template_set.add(template_name)
             return True
         return False
 
     def remove_template(self, template_name: str) -> bool:
         """Remove a template from the collection."""
-        if template_name in self.templates:
+        if template_name in self._template_set:
             self.templates.remove(template_name)
+            self._template_set.discard(template_name)
             return True
         return False
 
     def has_template(self, template_name: str) -> bool:
         """Check if collection contains a template."""
-        return template_name in self.templates
+        return template_name in self._template_set
 
 
 class CollectionStorage:
@@ -75,6 +208,11 @@ class CollectionStorage:
 
         # File to track the currently loaded collection
         self.current_collection_file = self.storage_path / ".current_collection"
+        # Last read of that file as ((mtime_ns, size), name)
+        self._current_collection_cache = None
+
+        # Cached collection metadata keyed by XML file mtime and size
+        self.collection_index_file = self.storage_path / ".collection_index.json"
 
     def save_collection(self, collection: Collection) -> bool:
         """Save a collection to XML format."""
@@ -86,234 +224,235 @@ class CollectionStorage:
         """Save a collection to XML format with a new template to embed."""
         return self.save_collection_to_xml(collection, new_template)
 
+    def save_collection_with_templates(
+        self, collection: Collection, new_templates: List["PromptTemplate"]
+    ) -> bool:
+        """Save a collection to XML format with several new templates to embed."""
+        return self.save_collection_to_xml(collection, new_templates=new_templates)
+
     def save_collection_to_xml(
-        self, collection: Collection, new_template: "PromptTemplate" = None
+        self,
+        collection: Collection,
+        new_template: "PromptTemplate" = None,
+        new_templates: Optional[List["PromptTemplate"]] = None,
     ) -> bool:
         """Save a collection to a single XML file with embedded templates."""
         try:
             xml_path = self.collections_path / f"{collection.name}.xml"
 
+            # Bind the element factory locally; it is called many times per template
+            sub_element = ET.SubElement
+
             # Create root element
             root = ET.Element("collection")
 
             # Add metadata
-            metadata = ET.SubElement(root, "metadata")
-            ET.SubElement(metadata, "name").text = collection.name
-            ET.SubElement(metadata, "description").text = collection.description or ""
+            metadata = sub_element(root, "metadata")
+            sub_element(metadata, "name").text = collection.name
+            sub_element(metadata, "description").text = collection.description or ""
 
             if collection.system_prompt:
-                ET.SubElement(metadata, "system_prompt").text = collection.system_prompt
+                sub_element(metadata, "system_prompt").text = collection.system_prompt
 
             # Add tags
             if collection.tags:
-                tags_elem = ET.SubElement(metadata, "tags")
+                tags_elem = sub_element(metadata, "tags")
                 for tag in collection.tags:
-                    ET.SubElement(tags_elem, "tag").text = tag
+                    sub_element(tags_elem, "tag").text = tag
 
-            ET.SubElement(metadata, "author").text = collection.author or ""
-            ET.SubElement(metadata, "created_at").text = collection.created_at
-            ET.SubElement(metadata, "updated_at").text = collection.updated_at
+            sub_element(metadata, "author").text = collection.author or ""
+            sub_element(metadata, "created_at").text = collection.created_at
+            sub_element(metadata, "updated_at").text = collection.updated_at
 
             # Add templates section
-            templates_elem = ET.SubElement(root, "templates")
+            templates_elem = sub_element(root, "templates")
 
             # Load and embed each template
-            template_idx = 0
-            cdata_replacements = []
+            cdata_sections: List[bytes] = []
+            cdata_nonce = uuid.uuid4().hex
+            pending_templates = {t.name: t for t in new_templates or []}
+            if new_template:
+                pending_templates[new_template.name] = new_template
+            embedded_templates = None
+            other_templates = None
 
             for template_name in collection.templates:
-                # Use new_template if it matches, otherwise load from collections
-                if new_template and new_template.name == template_name:
-                    template = new_template
-                else:
-                    template = self._load_template_for_collection(template_name)
+                # Use a new template if it matches, otherwise reuse the copy already
+                # embedded in this collection, and only then search other collections
+                template = pending_templates.get(template_name)
+                if template is None:
+                    if embedded_templates is None:
+                        embedded_templates = {
+                            embedded.name: embedded
+                            for embedded in self.get_all_xml_collection_templates(
+                                collection.name
+                            )
+                        }
+                    template = embedded_templates.get(template_name)
+
+                if template is None:
+                    # Index the other collections once per save, not per template
+                    if other_templates is None:
+                        other_templates = self._index_template_elements()
+                    template_elem = other_templates.get(template_name)
+                    if template_elem is not None:
+                        template = self._template_from_element(template_elem)
                 if template:
-                    template_elem = ET.SubElement(templates_elem, "template")
+                    template_elem = sub_element(templates_elem, "template")
 
                     # Template metadata
-                    tmpl_metadata = ET.SubElement(template_elem, "metadata")
-                    ET.SubElement(tmpl_metadata, "name").text = template.name
-                    ET.SubElement(tmpl_metadata, "description").text = (
+                    tmpl_metadata = sub_element(template_elem, "metadata")
+                    sub_element(tmpl_metadata, "name").text = template.name
+                    sub_element(tmpl_metadata, "description").text = (
                         template.description or ""
                     )
-                    ET.SubElement(
-                        tmpl_metadata, "created_at"
-                    ).text = template.created_at
-                    ET.SubElement(
-                        tmpl_metadata, "updated_at"
-                    ).text = template.updated_at
+                    sub_element(tmpl_metadata, "created_at").text = template.created_at
+                    sub_element(tmpl_metadata, "updated_at").text = template.updated_at
 
                     # Add tags if present
                     if template.tags:
-                        tags_elem = ET.SubElement(tmpl_metadata, "tags")
+                        tags_elem = sub_element(tmpl_metadata, "tags")
                         for tag in template.tags:
-                            ET.SubElement(tags_elem, "tag").text = tag
+                            sub_element(tags_elem, "tag").text = tag
 
                     # Add variables if present
                     if template.variables:
-                        variables_elem = ET.SubElement(tmpl_metadata, "variables")
+                        variables_elem = sub_element(tmpl_metadata, "variables")
                         for var in template.variables:
-                            ET.SubElement(variables_elem, "variable").text = var
+                            sub_element(variables_elem, "variable").text = var
 
                     # Placeholder generators
                     if template.placeholder_generators:
-                        generators_elem = ET.SubElement(
+                        generators_elem = sub_element(
                             tmpl_metadata, "placeholder_generators"
                         )
-                        for gen_idx, generator in enumerate(
-                            template.placeholder_generators
-                        ):
-                            gen_elem = ET.SubElement(
-                                generators_elem, "placeholder_generator"
-                            )
-                            gen_elem.set("language", generator.language)
-                            placeholder = f"PLACEHOLDER_GENERATOR_CDATA_{generator.language}_{template_idx}_{gen_idx}"
-                            gen_elem.text = placeholder
-                            cdata_replacements.append(
-                                (placeholder, f"<![CDATA[{generator.script}]]>")
+                        for generator in template.placeholder_generators:
+                            sub_element(
+                                generators_elem,
+                                "placeholder_generator",
+                                language=generator.language,
+                            ).text = _cdata_placeholder(
+                                cdata_sections, cdata_nonce, generator.script
                             )
 
                     # Template content with CDATA
-                    content_elem = ET.SubElement(template_elem, "content")
-                    content_placeholder = f"PLACEHOLDER_FOR_CDATA_{template_idx}"
-                    content_elem.text = content_placeholder
-                    cdata_replacements.append(
-                        (content_placeholder, f"<![CDATA[{template.template}]]>")
+                    content_elem = sub_element(template_elem, "content")
+                    content_elem.text = _cdata_placeholder(
+                        cdata_sections, cdata_nonce, template.template
                     )
 
-                    template_idx += 1
-
-            # Convert to string and replace placeholders with CDATA
+            # Serialize straight to UTF-8 bytes, declaration included
             ET.indent(root, space="  ", level=0)
-            xml_string = ET.tostring(root, encoding="unicode")
+            xml_bytes = ET.tostring(root, encoding="utf-8", xml_declaration=True)
 
-            # Add XML declaration
-            xml_string = '<?xml version="1.0" encoding="utf-8"?>\n' + xml_string
-
-            # Replace all CDATA placeholders
-            for placeholder, cdata_content in cdata_replacements:
-                xml_string = xml_string.replace(placeholder, cdata_content)
+            # Splice in all CDATA sections in a single pass
+            placeholder_re = re.compile(
+                rb"__AIX_CDATA_" + cdata_nonce.encode("ascii") + rb"_(\d+)__"
+            )
+            xml_bytes = placeholder_re.sub(
+                lambda match: cdata_sections[int(match.group(1))], xml_bytes
+            )
 
-            # Write to file
-            with open(xml_path, "w", encoding="utf-8") as f:
-                f.write(xml_string)
+            # Write to a temporary file and swap it in, so readers never see a
+            # partially written collection
+            tmp_path = xml_path.with_name(f"{xml_path.name}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(xml_bytes)
+                os.replace(tmp_path, xml_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            _clear_xml_caches()
+            self._drop_collection_index_entry(collection.name)
 
             return True
         except Exception as e:
             print(f"Error saving collection to XML: {e}")
             return False
 
-    def _load_template_for_collection(
-        self, template_name: str
-    ) -> Optional[PromptTemplate]:
-        """Load a template from any collection for embedding in another collection."""
-        # Search all collections for the template
-        for collection_xml in self.collections_path.glob("*.xml"):
-            collection_name = collection_xml.stem
-            template = self.get_xml_collection_template(collection_name, template_name)
-            if template:
-                return template
-
-        # If not found, return None - template will need to be created
-        return None
+    def _index_template_elements(self) -> Dict[str, ET.Element]:
+        """Map template names to their <template> elements across all collections.
+
+        The first collection that embeds a name wins, matching a linear search.
+        """
+        index: Dict[str, ET.Element] = {}
+        for collection_name in _list_xml_stems(self.collections_path):
+            xml_path = self.collections_path / f"{collection_name}.xml"
+            try:
+                collection_index = _read_xml_template_index(xml_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(
+                    f"Error indexing templates in XML collection {collection_name}: {e}"
+                )
+                continue
+            for name, template_elem in collection_index.items():
+                index.setdefault(name, template_elem)
+        return index
 
     def get_collection(self, name: str) -> Optional[Collection]:
         """Load a collection from XML format."""
+        # List any legacy directory first; a scandir is cheap next to an XML parse
+        try:
+            discovered_templates = _list_xml_stems(self.collections_path / name)
+        except (FileNotFoundError, NotADirectoryError):
+            discovered_templates = None
+
         # First try XML format
         xml_collection = self.get_collection_from_xml(name)
         if xml_collection:
             # For backward compatibility, also check directory for additional templates
-            collection_dir = self.collections_path / name
-            if collection_dir.exists() and collection_dir.is_dir():
-                # Auto-discover templates in directory and validate against actual files
-                discovered_templates = []
-                for xml_file in collection_dir.glob("*.xml"):
-                    template_name = xml_file.stem
-                    discovered_templates.append(template_name)
-
+            if discovered_templates:
                 # Use discovered templates as the authoritative list for directory-based collections
-                # This ensures consistency with actual file system state
-                all_templates = discovered_templates
-                if all_templates != xml_collection.templates:
-                    xml_collection.templates = all_templates
-                    xml_collection.updated_at = (
-                        __import__("datetime").datetime.now().isoformat()
-                    )
+                # This ensures consistency with actual file system state, but only
+                # rewrite the XML when membership differs, not merely the order
+                if set(discovered_templates) != set(xml_collection.templates):
+                    xml_collection.templates = discovered_templates
+                    xml_collection.updated_at = datetime.now().isoformat()
                     self.save_collection(xml_collection)
 
             return xml_collection
 
         # For backward compatibility, check for directory-based collection
-        collection_dir = self.collections_path / name
-        if collection_dir.exists() and collection_dir.is_dir():
-            # Auto-discover templates in directory
-            templates = []
-            for xml_file in collection_dir.glob("*.xml"):
-                templates.append(xml_file.stem)
-
-            if templates:
-                # Create a collection with discovered templates
-                from datetime import datetime
-
-                collection = Collection(
-                    name=name,
-                    description="",
-                    templates=templates,
-                    created_at=datetime.now().isoformat(),
-                    updated_at=datetime.now().isoformat(),
-                )
-                return collection
+        if discovered_templates:
+            # Create a collection with discovered templates
+            now = datetime.now().isoformat()
+            collection = Collection(
+                name=name,
+                description="",
+                templates=discovered_templates,
+                created_at=now,
+                updated_at=now,
+            )
+            return collection
 
         return None
 
     def get_collection_from_xml(self, name: str) -> Optional[Collection]:
         """Load a collection from an XML file."""
         xml_path = self.collections_path / f"{name}.xml"
-        if not xml_path.exists():
-            return None
 
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            if root.tag != "collection":
+            collection_data = _read_xml_collection_data(xml_path)
+            if collection_data is None:
                 return None
 
-            # Parse metadata
-            metadata = root.find("metadata")
-            if metadata is None:
-                return None
-
-            collection_data = {
-                "name": metadata.findtext("name", name),
-                "description": metadata.findtext("description", ""),
-                "system_prompt": metadata.findtext("system_prompt"),
-                "author": metadata.findtext("author", ""),
-                "created_at": metadata.findtext("created_at", ""),
-                "updated_at": metadata.findtext("updated_at", ""),
-                "tags": [],
-                "templates": [],
-            }
-
-            # Parse tags
-            tags_elem = metadata.find("tags")
-            if tags_elem is not None:
-                collection_data["tags"] = [
-                    tag.text for tag in tags_elem.findall("tag") if tag.text
-                ]
-
-            # Parse template names from embedded templates
-            templates_elem = root.find("templates")
-            if templates_elem is not None:
-                for template_elem in templates_elem.findall("template"):
-                    template_metadata = template_elem.find("metadata")
-                    if template_metadata is not None:
-                        template_name = template_metadata.findtext("name")
-                        if template_name:
-                            collection_data["templates"].append(template_name)
-
-            return Collection.from_dict(collection_data)
+            # Copy the cached lists so callers can mutate the collection freely
+            collection = Collection.from_dict(
+                {
+                    **collection_data,
+                    "tags": list(collection_data["tags"]),
+                    "templates": list(collection_data["templates"]),
+                }
+            )
+            if collection.name is None:
+                collection.name = name
+            return collection
 
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading collection from XML {xml_path}: {e}")
             return None
@@ -321,77 +460,156 @@ class CollectionStorage:
     def list_collections(self) -> List[Collection]:
         """List all available collections from XML format."""
         collections = []
+        index = self._load_collection_index()
+        fresh_index = {}
 
         # Scan for XML-based collections only
-        for xml_path in self.collections_path.glob("*.xml"):
-            name = xml_path.stem
-            collection = self.get_collection_from_xml(name)
+        for name in _list_xml_stems(self.collections_path):
+            try:
+                st = os.stat(self.collections_path / f"{name}.xml")
+            except FileNotFoundError:
+                continue
+
+            # Reuse indexed metadata when the XML file is unchanged; saves swap in
+            # a new file, so the inode changes even when mtime and size do not
+            signature = [st.st_ino, st.st_mtime_ns, st.st_size]
+            collection = None
+            entry = index.get(name)
+            if isinstance(entry, dict) and entry.get("signature") == signature:
+                try:
+                    collection = Collection.from_dict(entry["collection"])
+                except Exception:
+                    collection = None
+            if collection is None:
+                collection = self.get_collection_from_xml(name)
+
             if collection:
                 collections.append(collection)
+                fresh_index[name] = {
+                    "signature": signature,
+                    "collection": collection.to_dict(),
+                }
+
+        if fresh_index != index:
+            self._save_collection_index(fresh_index)
 
         # Also check for legacy directory-based collections and convert them
         self._migrate_legacy_collections()
 
         return sorted(collections, key=lambda c: c.name)
 
+    def _load_collection_index(self) -> Dict[str, Any]:
+        """Load the cached collection metadata index."""
+        try:
+            with open(self.collection_index_file, "rb") as f:
+                index = json.loads(f.read())
+        except Exception:
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_collection_index(self, index: Dict[str, Any]) -> None:
+        """Persist the collection metadata index."""
+        index_path = self.collection_index_file
+        tmp_path = index_path.with_name(f"{index_path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"Error saving collection index: {e}")
+
+    def _drop_collection_index_entry(self, name: str) -> None:
+        """Remove a collection's cached metadata after its XML file changes."""
+        index = self._load_collection_index()
+        if index.pop(name, None) is not None:
+            self._save_collection_index(index)
+
     def _migrate_legacy_collections(self) -> None:
         """Migrate any legacy directory-based collections to XML format."""
         if not self.collections_path.exists():
             return
 
-        for collection_dir in self.collections_path.glob("*"):
-            if collection_dir.is_dir():
-                collection_name = collection_dir.name
-                xml_path = self.collections_path / f"{collection_name}.xml"
-
-                # Skip if XML already exists
-                if xml_path.exists():
-                    continue
-
-                # Create collection from directory
-                templates = []
-                for xml_file in collection_dir.glob("*.xml"):
-                    templates.append(xml_file.stem)
-
-                if templates:
-                    from datetime import datetime
-
-                    collection = Collection(
-                        name=collection_name,
-                        description="Migrated from directory-based collection",
-                        templates=templates,
-                        created_at=datetime.now().isoformat(),
-                        updated_at=datetime.now().isoformat(),
-                    )
+        # One scan yields both the directories and the XML files that already exist
+        collection_dirs = []
+        xml_stems = set()
+        with os.scandir(self.collections_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    collection_dirs.append(entry)
+                elif entry.name.endswith(".xml"):
+                    xml_stems.add(entry.name[:-4])
+
+        # Skip directories whose XML already exists
+        collection_dirs = [
+            entry for entry in collection_dirs if entry.name not in xml_stems
+        ]
+        if not collection_dirs:
+            return
+
+        # Each directory migrates to its own XML file, so run them concurrently
+        # and report from this thread once all are done
+        with ThreadPoolExecutor(max_workers=min(8, len(collection_dirs))) as executor:
+            migrated = list(
+                executor.map(self._migrate_legacy_collection, collection_dirs)
+            )
+
+        messages = [
+            f"Migrated collection '{collection_name}' to XML format"
+            for collection_name in migrated
+            if collection_name
+        ]
+        if messages:
+            sys.stdout.write("\n".join(messages) + "\n")
+
+    def _migrate_legacy_collection(self, collection_dir: os.DirEntry) -> Optional[str]:
+        """Migrate one legacy collection directory, returning its name on success."""
+        collection_name = collection_dir.name
 
-                    # Save as XML collection
-                    if self.save_collection_to_xml(collection):
-                        print(f"Migrated collection '{collection_name}' to XML format")
-                        # Optionally remove the old directory after successful migration
-                        # import shutil
-                        # shutil.rmtree(collection_dir)
+        # Create collection from directory
+        templates = _list_xml_stems(collection_dir.path)
+
+        if not templates:
+            return None
+
+        now = datetime.now().isoformat()
+        collection = Collection(
+            name=collection_name,
+            description="Migrated from directory-based collection",
+            templates=templates,
+            created_at=now,
+            updated_at=now,
+        )
+
+        # Save as XML collection
+        if self.save_collection_to_xml(collection):
+            # Optionally remove the old directory after successful migration
+            # import shutil
+            # shutil.rmtree(collection_dir)
+            return collection_name
+        return None
 
     def delete_collection(self, name: str) -> bool:
         """Delete a collection from XML storage."""
         # Delete XML collection
         xml_path = self.collections_path / f"{name}.xml"
-        if xml_path.exists():
-            try:
-                xml_path.unlink()
-                # Clear current collection if it was the deleted one
-                if self.get_current_collection() == name:
-                    self.clear_current_collection()
-                return True
-            except Exception as e:
-                print(f"Error deleting XML collection {xml_path}: {e}")
-                return False
-        else:
+        try:
+            xml_path.unlink()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error deleting XML collection {xml_path}: {e}")
             return False
+        self._drop_collection_index_entry(name)
+
+        # Clear current collection if it was the deleted one
+        if self.get_current_collection() == name:
+            self.clear_current_collection()
+        return True
 
     def collection_exists(self, name: str) -> bool:
         """Check if a collection exists in XML format."""
-        xml_path = self.collections_path / f"{name}.xml"
-        return xml_path.exists()
+        return os.path.isfile(self.collections_path / f"{name}.xml")
 
     def set_current_collection(self, name: str) -> bool:
         """Set the current active collection."""
@@ -399,6 +617,7 @@ class CollectionStorage:
             try:
                 with open(self.current_collection_file, "w") as f:
                     f.write(name)
+                self._current_collection_cache = None
                 return True
             except Exception as e:
                 print(f"Error setting current collection: {e}")
@@ -406,25 +625,36 @@ class CollectionStorage:
 
     def get_current_collection(self) -> Optional[str]:
         """Get the name of the current active collection."""
-        if self.current_collection_file.exists():
+        try:
+            st = os.stat(self.current_collection_file)
+        except OSError:
+            return None
+
+        # Only re-read the file when it has changed since the last read
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._current_collection_cache
+        if cached is not None and cached[0] == signature:
+            name = cached[1]
+        else:
             try:
-                with open(self.current_collection_file, "r") as f:
-                    name = f.read().strip()
-                    # Verify the collection still exists
-                    if self.collection_exists(name):
-                        return name
-                    else:
-                        # Clean up stale reference
-                        self.clear_current_collection()
+                name = self.current_collection_file.read_text(encoding="utf-8").strip()
             except Exception:
-                pass
+                return None
+            self._current_collection_cache = (signature, name)
+
+        # Verify the collection still exists
+        if self.collection_exists(name):
+            return name
+
+        # Clean up stale reference
+        self.clear_current_collection()
         return None
 
     def clear_current_collection(self) -> bool:
         """Clear the current collection."""
         try:
-            if self.current_collection_file.exists():
-                self.current_collection_file.unlink()
+            self.current_collection_file.unlink(missing_ok=True)
+            self._current_collection_cache = None
             return True
         except Exception as e:
             print(f"Error clearing current collection: {e}")
@@ -435,109 +665,119 @@ class CollectionStorage:
     ) -> Optional[PromptTemplate]:
         """Get a specific template from an XML collection."""
         xml_path = self.collections_path / f"{collection_name}.xml"
-        if not xml_path.exists():
-            return None
 
         try:
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-
-            # Find the template in the XML
-            templates_elem = root.find("templates")
-            if templates_elem is not None:
-                for template_elem in templates_elem.findall("template"):
-                    template_metadata = template_elem.find("metadata")
-                    if template_metadata is not None:
-                        name = template_metadata.findtext("name")
-                        if name == template_name:
-                            # Parse template data
-                            template_data = {
-                                "name": name,
-                                "description": template_metadata.findtext(
-                                    "description", ""
-                                ),
-                                "created_at": template_metadata.findtext(
-                                    "created_at", ""
-                                ),
-                                "updated_at": template_metadata.findtext(
-                                    "updated_at", ""
-                                ),
-                                "template": "",
-                                "tags": [],
-                                "variables": [],
-                                "placeholder_generators": [],
-                            }
-
-                            # Parse tags
-                            tags_elem = template_metadata.find("tags")
-                            if tags_elem is not None:
-                                template_data["tags"] = [
-                                    tag.text
-                                    for tag in tags_elem.findall("tag")
-                                    if tag.text
-                                ]
-
-                            # Parse variables
-                            variables_elem = template_metadata.find("variables")
-                            if variables_elem is not None:
-                                template_data["variables"] = [
-                                    var.text
-                                    for var in variables_elem.findall("variable")
-                                    if var.text
-                                ]
-
-                            # Parse placeholder generators
-                            generators_elem = template_metadata.find(
-                                "placeholder_generators"
-                            )
-                            if generators_elem is not None:
-                                for gen_elem in generators_elem.findall(
-                                    "placeholder_generator"
-                                ):
-                                    language = gen_elem.get("language", "")
-                                    script = gen_elem.text or ""
-                                    if language and script:
-                                        template_data["placeholder_generators"].append(
-                                            {"language": language, "script": script}
-                                        )
-
-                            # Get content (handle CDATA)
-                            content_elem = template_elem.find("content")
-                            if content_elem is not None and content_elem.text:
-                                template_data["template"] = content_elem.text
-
-                            return PromptTemplate.from_dict(template_data)
+            template_elem = _read_xml_template_index(xml_path).get(template_name)
+            if template_elem is None:
+                return None
+            return self._template_from_element(template_elem)
 
+        except FileNotFoundError:
             return None
-
         except Exception as e:
             print(
                 f"Error loading template {template_name} from XML collection {collection_name}: {e}"
             )
             return None
 
-    def get_collection_templates(
-        self, collection_name: str, storage: PromptStorage
+    def get_all_xml_collection_templates(
+        self, collection_name: str
     ) -> List[PromptTemplate]:
-        """Get all templates that belong to a collection."""
-        collection = self.get_collection(collection_name)
-        if not collection:
+        """Get every template embedded in an XML collection with a single parse."""
+        try:
+            return list(self._iter_xml_templates(collection_name))
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Error loading templates from XML collection {collection_name}: {e}")
             return []
 
-        templates = []
+    def _iter_xml_templates(
+        self, collection_name: str, names: Optional[Set[str]] = None
+    ) -> Iterator[PromptTemplate]:
+        """Yield templates embedded in an XML collection, optionally only some names.
 
-        # Check if this is an XML collection
+        The file is stream-parsed and each <template> is cleared once it has been
+        read, so only one template body is held at a time.
+        """
         xml_path = self.collections_path / f"{collection_name}.xml"
-        if xml_path.exists():
-            # Load templates directly from XML collection
-            for template_name in collection.templates:
-                template = self.get_xml_collection_template(
-                    collection_name, template_name
+        for _, elem in ET.iterparse(xml_path, events=("end",)):
+            if elem.tag != "template":
+                continue
+            name = elem.findtext("metadata/name")
+            template = None
+            if name and (names is None or name in names):
+                template = self._template_from_element(elem)
+            elem.clear()
+            if template is not None:
+                yield template
+
+    @staticmethod
+    def _template_from_element(template_elem: ET.Element) -> PromptTemplate:
+        """Build a PromptTemplate from an embedded <template> element."""
+        template_metadata = template_elem.find("metadata")
+        template_data = {
+            "name": template_metadata.findtext("name"),
+            "description": template_metadata.findtext("description", ""),
+            "created_at": template_metadata.findtext("created_at", ""),
+            "updated_at": template_metadata.findtext("updated_at", ""),
+            "template": "",
+            "tags": [],
+            "variables": [],
+            "placeholder_generators": [],
+        }
+
+        # Parse tags
+        template_data["tags"] = [
+            tag.text for tag in template_metadata.iterfind("tags/tag") if tag.text
+        ]
+
+        # Parse variables
+        template_data["variables"] = [
+            var.text
+            for var in template_metadata.iterfind("variables/variable")
+            if var.text
+        ]
+
+        # Parse placeholder generators
+        for gen_elem in template_metadata.iterfind(
+            "placeholder_generators/placeholder_generator"
+        ):
+            language = gen_elem.get("language", "")
+            script = gen_elem.text or ""
+            if language and script:
+                template_data["placeholder_generators"].append(
+                    PlaceholderGenerator(language=language, script=script)
                 )
-                if template:
-                    templates.append(template)
 
-        return templates
+        # Get content (handle CDATA)
+        template_data["template"] = template_elem.findtext("content") or ""
+
+        # Fields are already typed, so skip from_dict's copy and conversion
+        return PromptTemplate(**template_data)
+
+    def get_collection_templates(
+        self, collection_name: str, storage: PromptStorage
+    ) -> List[PromptTemplate]:
+        """Get all templates that belong to a collection."""
+        return list(self.iter_collection_templates(collection_name, storage))
+
+    def iter_collection_templates(
+        self, collection_name: str, storage: Optional[PromptStorage] = None
+    ) -> Iterator[PromptTemplate]:
+        """Yield the templates that belong to a collection one at a time."""
+        collection = self.get_collection(collection_name)
+        if not collection:
+            return
+
+        try:
+            yield from self._iter_xml_templates(
+                collection_name, set(collection.templates)
+            )
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error loading templates from XML collection {collection_name}: {e}")
 
     def validate_collection_templates(
         self, collection_name: str, storage: PromptStorage
@@ -554,25 +794,31 @@ class CollectionStorage:
         xml_path = self.collections_path / f"{collection_name}.xml"
         if not xml_path.exists():
             collection_dir = self.collections_path / collection_name
-            if collection_dir.exists() and collection_dir.is_dir():
+            if collection_dir.is_dir():
                 # Auto-discover templates in directory
-                discovered_templates = []
-                for xml_file in collection_dir.glob("*.xml"):
-                    template_name = xml_file.stem
-                    discovered_templates.append(template_name)
+                discovered_templates = _list_xml_stems(collection_dir)
 
                 # Update collection with discovered templates
                 if discovered_templates:
                     collection.templates = discovered_templates
-                    collection.updated_at = (
-                        __import__("datetime").datetime.now().isoformat()
-                    )
+                    collection.updated_at = datetime.now().isoformat()
                     self.save_collection(collection)
 
+        # Check membership against name sets instead of a lookup per template:
+        # this collection's embedded templates first, then every stored template
+        try:
+            embedded_names = _read_xml_template_index(xml_path).keys()
+        except FileNotFoundError:
+            embedded_names = set()
+        stored_names = None
+
         for template_name in collection.templates:
-            if storage.prompt_exists(template_name, collection_name):
+            if template_name in embedded_names:
                 valid.append(template_name)
-            elif storage.prompt_exists(template_name):
+                continue
+            if stored_names is None:
+                stored_names = storage.list_prompt_names()
+            if template_name in stored_names:
                 valid.append(template_name)
             else:
                 missing.append(template_name)
@@ -600,16 +846,15 @@ class CollectionManager:
         if self.collection_storage.collection_exists(name):
             return False
 
-        from datetime import datetime
-
+        now = datetime.now().isoformat()
         collection = Collection(
             name=name,
             description=description,
             templates=templates or [],
             system_prompt=system_prompt,
             tags=tags or [],
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now,
+            updated_at=now,
         )
 
         return self.collection_storage.save_collection(collection)
@@ -618,26 +863,32 @@ class CollectionManager:
         self, collection_name: str, template: "PromptTemplate"
     ) -> bool:
         """Add a template to a collection."""
+        return self.add_templates_to_collection(collection_name, [template])
+
+    def add_templates_to_collection(
+        self, collection_name: str, templates: List["PromptTemplate"]
+    ) -> bool:
+        """Add several templates to a collection with a single save."""
+        now = datetime.now().isoformat()
         collection = self.collection_storage.get_collection(collection_name)
         if not collection:
             # Create collection if it doesn't exist
-            from datetime import datetime
-
             collection = Collection(
                 name=collection_name,
                 description="",
                 templates=[],
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
+                created_at=now,
+                updated_at=now,
             )
 
-        if collection.add_template(template.name):
-            from datetime import datetime
-
-            collection.updated_at = datetime.now().isoformat()
-            # Save with the template object for embedding
-            return self.collection_storage.save_collection_with_template(
-                collection, template
+        added = [
+            template for template in templates if collection.add_template(template.name)
+        ]
+        if added:
+            collection.updated_at = now
+            # Save with the template objects for embedding
+            return self.collection_storage.save_collection_with_templates(
+                collection, added
             )
         return False
 
@@ -650,26 +901,24 @@ class CollectionManager:
             return False
 
         if collection.remove_template(template_name):
-            from datetime import datetime
-
             collection.updated_at = datetime.now().isoformat()
             return self.collection_storage.save_collection(collection)
         return False
 
     def get_template_collection(self, template_name: str) -> Optional[str]:
         """Find which collection contains the given template."""
-        for collection_xml in self.collections_path.glob("*.xml"):
-            collection_name = collection_xml.stem
+        for collection_name in _list_xml_stems(
+            self.collection_storage.collections_path
+        ):
             collection = self.collection_storage.get_collection(collection_name)
-            if collection and template_name in collection.templates:
+            if collection and collection.has_template(template_name):
                 return collection_name
         return None
 
     def load_collection(self, name: str) -> bool:
         """Load a collection as the current working collection."""
-        if self.collection_storage.collection_exists(name):
-            return self.collection_storage.set_current_collection(name)
-        return False
+        # set_current_collection already verifies that the collection exists
+        return self.collection_storage.set_current_collection(name)
 
     def get_default_collection(self) -> str:
         """Get the default collection name."""
@@ -716,20 +965,26 @@ class CollectionManager:
 
     def add_template_to_current_collection(self, template_name: str) -> bool:
         """Add a template to the current collection."""
+        return self.add_templates_to_current_collection([template_name])
+
+    def add_templates_to_current_collection(self, template_names: List[str]) -> bool:
+        """Add several existing templates to the current collection with one save."""
         current = self.collection_storage.get_current_collection()
         if not current:
             return False
 
-        if not self.prompt_storage.prompt_exists(template_name):
+        # One snapshot of stored names instead of a lookup per template
+        existing = self.prompt_storage.list_prompt_names()
+        template_names = [name for name in template_names if name in existing]
+        if not template_names:
             return False
 
         collection = self.collection_storage.get_collection(current)
         if not collection:
             return False
 
-        if collection.add_template(template_name):
-            from datetime import datetime
-
+        added = [name for name in template_names if collection.add_template(name)]
+        if added:
             collection.updated_at = datetime.now().isoformat()
             return self.collection_storage.save_collection(collection)
 
@@ -746,8 +1001,6 @@ class CollectionManager:
             return False
 
         if collection.remove_template(template_name):
-            from datetime import datetime
-
             collection.updated_at = datetime.now().isoformat()
             return self.collection_storage.save_collection(collection)
 
@@ -760,10 +1013,9 @@ class CollectionManager:
         include_templates: bool = True,
     ) -> bool:
         """Export a collection as a bundle (tar.gz with XML and templates)."""
+        import io
         import tarfile
-        import tempfile
-        import json
-        from datetime import datetime
+        import time
 
         # Check if collection exists
         collection = self.collection_storage.get_collection(collection_name)
@@ -777,13 +1029,15 @@ class CollectionManager:
         bundle_file = export_path / f"{collection_name}-bundle.tar.gz"
 
         try:
-            with tarfile.open(bundle_file, "w:gz") as tar:
+            with tarfile.open(bundle_file, "w:gz", compresslevel=1) as tar:
                 # Add collection XML file
                 xml_path = (
                     self.collection_storage.collections_path / f"{collection_name}.xml"
                 )
-                if xml_path.exists():
+                try:
                     tar.add(xml_path, arcname=f"{collection_name}.xml")
+                except FileNotFoundError:
+                    pass
 
                 # Create manifest
                 manifest = {
@@ -794,52 +1048,45 @@ class CollectionManager:
                     "templates": collection.templates,
                 }
 
-                # Add manifest as JSON
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                ) as f:
-                    json.dump(manifest, f, indent=2)
-                    manifest_path = Path(f.name)
-
-                tar.add(manifest_path, arcname="manifest.json")
-                manifest_path.unlink()
+                # Stream manifest JSON straight into the archive
+                manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
+                manifest_info = tarfile.TarInfo("manifest.json")
+                manifest_info.size = len(manifest_bytes)
+                manifest_info.mtime = int(time.time())
+                manifest_info.mode = 0o644
+                tar.addfile(manifest_info, io.BytesIO(manifest_bytes))
 
                 # Include template files if requested
                 if include_templates:
+                    get_prompt = self.prompt_storage.get_prompt
+
+                    # List the storage directory once instead of probing each file
+                    with os.scandir(self.prompt_storage.storage_path) as entries:
+                        storage_files = {
+                            entry.name: entry.path
+                            for entry in entries
+                            if entry.is_file()
+                        }
+
                     for template_name in collection.templates:
-                        template = self.prompt_storage.get_prompt(template_name)
+                        template = get_prompt(template_name)
                         if template:
-                            # Add template metadata (YAML/JSON)
-                            metadata_path = (
-                                self.prompt_storage.storage_path
-                                / f"{template_name}.yaml"
-                            )
-                            if metadata_path.exists():
-                                tar.add(
-                                    metadata_path,
-                                    arcname=f"templates/{template_name}.yaml",
-                                )
-                            else:
-                                # Try JSON format
-                                metadata_path = (
-                                    self.prompt_storage.storage_path
-                                    / f"{template_name}.json"
-                                )
-                                if metadata_path.exists():
+                            # Add template metadata (YAML, falling back to JSON)
+                            for ext in ("yaml", "json"):
+                                metadata_file = f"{template_name}.{ext}"
+                                if metadata_file in storage_files:
                                     tar.add(
-                                        metadata_path,
-                                        arcname=f"templates/{template_name}.json",
+                                        storage_files[metadata_file],
+                                        arcname=f"templates/{metadata_file}",
                                     )
+                                    break
 
                             # Add template content
-                            content_path = (
-                                self.prompt_storage.storage_path
-                                / f"{template_name}.txt"
-                            )
-                            if content_path.exists():
+                            content_file = f"{template_name}.txt"
+                            if content_file in storage_files:
                                 tar.add(
-                                    content_path,
-                                    arcname=f"templates/{template_name}.txt",
+                                    storage_files[content_file],
+                                    arcname=f"templates/{content_file}",
                                 )
 
             return True
@@ -851,9 +1098,8 @@ class CollectionManager:
         self, import_path: Path, overwrite: bool = False
     ) -> Dict[str, Any]:
         """Import a collection from a bundle file."""
+        import io
         import tarfile
-        import json
-        import tempfile
         import shutil
 
         import_path = Path(import_path)
@@ -867,109 +1113,127 @@ class CollectionManager:
 
         try:
             if import_path.suffix == ".gz" and import_path.name.endswith(".tar.gz"):
-                # Handle bundle import
-                with tarfile.open(import_path, "r:gz") as tar:
-                    # Extract to temporary directory
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        temp_path = Path(temp_dir)
-                        tar.extractall(
-                            temp_path, filter="data"
-                        )  # Use filter for security
-
-                        # Read manifest
-                        manifest_path = temp_path / "manifest.json"
-                        if not manifest_path.exists():
-                            result["errors"].append("Invalid bundle: missing manifest")
-                            return result
-
-                        with open(manifest_path) as f:
-                            manifest = json.load(f)
-
-                        collection_name = manifest["collection_name"]
-                        result["collection_name"] = collection_name
-
-                        # Check if collection exists
-                        if (
-                            self.collection_storage.collection_exists(collection_name)
-                            and not overwrite
-                        ):
-                            result["errors"].append(
-                                f"Collection '{collection_name}' already exists (use --overwrite)"
-                            )
-                            return result
-
-                        # Import collection XML
-                        xml_path = temp_path / f"{collection_name}.xml"
-                        if xml_path.exists():
-                            dest_xml_path = (
-                                self.collection_storage.collections_path
-                                / f"{collection_name}.xml"
-                            )
-                            shutil.copy2(xml_path, dest_xml_path)
+                # Handle bundle import, streaming members straight to their
+                # destinations instead of extracting to a temporary directory
+                collections_path = self.collection_storage.collections_path
+                storage_path = self.prompt_storage.storage_path
+                copy_fileobj = shutil.copyfileobj
+                imported = result["imported_templates"]
+                skipped = result["skipped_templates"]
+                imported_names: Set[str] = set()
+                skipped_names: Set[str] = set()
+                existing_templates: Set[str] = set()
+                # Content files seen before their template's metadata
+                deferred_content: Dict[str, bytes] = {}
+                # Members read before the manifest names the collection
+                pending: List[tuple] = []
+                collection_name = None
+                # Template files are small and numerous, so overlap their writes
+                pool = ThreadPoolExecutor(max_workers=8)
+                writes = []
+
+                def write_template(file_name: str, data: bytes) -> None:
+                    writes.append(
+                        pool.submit((storage_path / file_name).write_bytes, data)
+                    )
 
-                        # Import templates if they exist in bundle
-                        templates_dir = temp_path / "templates"
-                        if templates_dir.exists():
-                            for template_file in templates_dir.glob("*.yaml"):
-                                template_name = template_file.stem
+                def import_member(name: str, fileobj: IO[bytes]) -> None:
+                    if "/" not in name:
+                        if name == f"{collection_name}.xml":
+                            with open(collections_path / name, "wb") as dest:
+                                copy_fileobj(fileobj, dest, _COPY_BUFSIZE)
+                            _clear_xml_caches()
+                        return
+
+                    # Only plain files directly under templates/ are imported
+                    folder, _, file_name = name.partition("/")
+                    stem, _, ext = file_name.rpartition(".")
+                    if folder != "templates" or "/" in file_name or not stem:
+                        return
+
+                    if ext in ("yaml", "json"):
+                        # Skip if template already exists and not overwriting
+                        if stem in existing_templates:
+                            if stem not in skipped_names:
+                                skipped_names.add(stem)
+                                skipped.append(stem)
+                            return
+                        write_template(file_name, fileobj.read())
+                        if stem not in imported_names:
+                            imported_names.add(stem)
+                            imported.append(stem)
+                    elif ext == "txt":
+                        if stem in imported_names:
+                            write_template(file_name, fileobj.read())
+                        elif stem not in skipped_names:
+                            deferred_content[stem] = fileobj.read()
 
-                                # Skip if template already exists and not overwriting
+                try:
+                    with (
+                        open(import_path, "rb") as bundle,
+                        tarfile.open(
+                            fileobj=bundle, mode="r|gz", bufsize=_TAR_BUFSIZE
+                        ) as tar,
+                    ):
+                        # The bundle is read once, front to back
+                        _fadvise(bundle, "POSIX_FADV_SEQUENTIAL")
+                        for member in tar:
+                            if not member.isfile():
+                                continue
+                            name = member.name
+                            if name.startswith("./"):
+                                name = name[2:]
+                            fileobj = tar.extractfile(member)
+
+                            if collection_name is not None:
+                                import_member(name, fileobj)
+                            elif name == "manifest.json":
+                                manifest = json.loads(fileobj.read())
+                                collection_name = manifest["collection_name"]
+                                result["collection_name"] = collection_name
+
+                                # Check if collection exists
                                 if (
-                                    self.prompt_storage.prompt_exists(template_name)
+                                    self.collection_storage.collection_exists(
+                                        collection_name
+                                    )
                                     and not overwrite
                                 ):
-                                    result["skipped_templates"].append(template_name)
-                                    continue
+                                    result["errors"].append(
+                                        f"Collection '{collection_name}' already exists (use --overwrite)"
+                                    )
+                                    return result
 
-                                # Import template metadata
-                                dest_metadata_path = (
-                                    self.prompt_storage.storage_path
-                                    / f"{template_name}.yaml"
-                                )
-                                shutil.copy2(template_file, dest_metadata_path)
-
-                                # Import template content
-                                content_file = templates_dir / f"{template_name}.txt"
-                                if content_file.exists():
-                                    dest_content_path = (
-                                        self.prompt_storage.storage_path
-                                        / f"{template_name}.txt"
+                                # Snapshot existing template names once for the import
+                                if not overwrite:
+                                    existing_templates = (
+                                        self.prompt_storage.list_prompt_names()
                                     )
-                                    shutil.copy2(content_file, dest_content_path)
 
-                                result["imported_templates"].append(template_name)
+                                for pending_name, data in pending:
+                                    import_member(pending_name, io.BytesIO(data))
+                                pending.clear()
+                            else:
+                                pending.append((name, fileobj.read()))
 
-                            # Also check for JSON files
-                            for template_file in templates_dir.glob("*.json"):
-                                template_name = template_file.stem
+                        _fadvise(bundle, "POSIX_FADV_DONTNEED")
 
-                                # Skip if template already exists and not overwriting
-                                if (
-                                    self.prompt_storage.prompt_exists(template_name)
-                                    and not overwrite
-                                ):
-                                    result["skipped_templates"].append(template_name)
-                                    continue
+                    if collection_name is None:
+                        result["errors"].append("Invalid bundle: missing manifest")
+                        return result
 
-                                # Import template metadata
-                                dest_metadata_path = (
-                                    self.prompt_storage.storage_path
-                                    / f"{template_name}.json"
-                                )
-                                shutil.copy2(template_file, dest_metadata_path)
-
-                                # Import template content
-                                content_file = templates_dir / f"{template_name}.txt"
-                                if content_file.exists():
-                                    dest_content_path = (
-                                        self.prompt_storage.storage_path
-                                        / f"{template_name}.txt"
-                                    )
-                                    shutil.copy2(content_file, dest_content_path)
+                    # Import content whose metadata came later in the bundle
+                    for stem, data in deferred_content.items():
+                        if stem in imported_names:
+                            write_template(f"{stem}.txt", data)
+                finally:
+                    pool.shutdown(wait=True)
 
-                                result["imported_templates"].append(template_name)
+                # Surface any failed write
+                for write in writes:
+                    write.result()
 
-                        result["success"] = True
+                result["success"] = True
 
             elif import_path.suffix == ".xml":
                 # Handle legacy XML import
@@ -990,7 +1254,8 @@ class CollectionManager:
                 dest_path = (
                     self.collection_storage.collections_path / f"{collection_name}.xml"
                 )
-                shutil.copy2(import_path, dest_path)
+                shutil.copyfile(import_path, dest_path)
+                _clear_xml_caches()
 
                 # Load collection to get template names for result
                 collection = self.collection_storage.get_collection(collection_name)
@@ -1059,15 +1324,16 @@ class CollectionManager:
 
                 # Look for collections in the collections folder
                 collections_dir = repo_path / "collections"
-                if not collections_dir.exists():
+                # Find XML collection files with a single directory scan
+                try:
+                    available_collections = _list_xml_stems(collections_dir)
+                except (FileNotFoundError, NotADirectoryError):
                     result["errors"].append(
                         "No 'collections' folder found in repository"
                     )
                     return result
 
-                # Find XML collection files
-                collection_files = list(collections_dir.glob("*.xml"))
-                if not collection_files:
+                if not available_collections:
                     result["errors"].append(
                         "No XML collection files found in collections folder"
                     )
@@ -1075,17 +1341,15 @@ class CollectionManager:
 
                 # If collection_name is specified, try to find that specific collection
                 if collection_name:
-                    target_file = collections_dir / f"{collection_name}.xml"
-                    if target_file.exists():
-                        collection_files = [target_file]
+                    if collection_name in available_collections:
+                        available_collections = [collection_name]
                     else:
                         result["errors"].append(
                             f"Collection '{collection_name}' not found in repository"
                         )
                         return result
-                elif len(collection_files) > 1:
+                elif len(available_collections) > 1:
                     # Multiple collections found, let user know
-                    available_collections = [f.stem for f in collection_files]
                     result["errors"].append(
                         f"Multiple collections found: {', '.join(available_collections)}. "
                         "Please specify which collection to import using the collection name parameter"
@@ -1094,8 +1358,10 @@ class CollectionManager:
 
                 # Import each collection file found
                 imported_any = False
-                for collection_file in collection_files:
-                    import_result = self.import_collection(collection_file, overwrite)
+                for stem in available_collections:
+                    import_result = self.import_collection(
+                        collections_dir / f"{stem}.xml", overwrite
+                    )
 
                     if import_result["success"]:
                         imported_any = True
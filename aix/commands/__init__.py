@@ -1,7 +1,8 @@
+from typing import Any
+
 from .base import Command, SecurityValidator
 from .security import DefaultSecurityValidator, CompositeSecurityValidator
 from .executor import CommandExecutor, ShellCommand, IntelligentShellCommand
-from .cli import test_cmd, show_commands, template_test
 
 __all__ = [
     "Command",
@@ -15,3 +16,13 @@ __all__ = [
     "show_commands",
     "template_test",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI helpers pull in typer and rich, which library users of the
+    # executor (e.g. PromptTemplate) never need
+    if name in ("test_cmd", "show_commands", "template_test"):
+        from . import cli
+
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
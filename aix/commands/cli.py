@@ -1,12 +1,30 @@
 import typer
+from functools import lru_cache
+from pathlib import Path
 from rich.console import Console
-from typing import Optional
-from .executor import CommandExecutor
+from typing import Optional, Tuple
+from ..config import get_config
+from .executor import _COMMAND_RE, CommandExecutor
 from .security import DefaultSecurityValidator
 
 console = Console()
 
 
+@lru_cache(maxsize=8)
+def _get_executor(
+    disabled_commands: Tuple[str, ...], timeout: int, working_dir: Path
+) -> CommandExecutor:
+    """Return a shared executor for one disabled-command set, timeout and cwd."""
+    security_validator = DefaultSecurityValidator(
+        disabled_commands=list(disabled_commands) or None
+    )
+    return CommandExecutor(
+        security_validator=security_validator,
+        working_dir=working_dir,
+        timeout=timeout,
+    )
+
+
 def test_cmd(
     command: str = typer.Argument(..., help="Command to test"),
     timeout: int = typer.Option(
@@ -14,21 +32,16 @@ def test_cmd(
     ),
 ):
     """Test a command to see if it's allowed and get its output."""
-    from ..config import Config
-
-    config = Config()
+    config = get_config()
 
     disabled_commands = config.get_disabled_commands()
-    security_validator = DefaultSecurityValidator(
-        disabled_commands=disabled_commands or None
-    )
-    executor = CommandExecutor(security_validator=security_validator, timeout=timeout)
+    executor = _get_executor(tuple(disabled_commands), timeout, Path.cwd())
 
     # Check if command is allowed
     if not executor.is_command_allowed(command):
         console.print(f"Command disabled for security: {command}", style="red")
         console.print("Disabled command patterns:", style="yellow")
-        for cmd in security_validator.disabled_commands:
+        for cmd in executor.security_validator.disabled_commands:
             console.print(f"  - {cmd}", style="dim")
         return
 
@@ -51,9 +64,7 @@ def test_cmd(
 
 def show_commands():
     """Show command execution status and disabled commands."""
-    from ..config import Config
-
-    config = Config()
+    config = get_config()
 
     disabled_commands = config.get_disabled_commands()
     commands_enabled = config.get_commands_enabled()
@@ -86,23 +97,18 @@ def template_test(
     ),
 ):
     """Test a template with command execution."""
-    from ..config import Config
-
-    config = Config()
+    config = get_config()
 
     disabled_commands = config.get_disabled_commands()
-    security_validator = DefaultSecurityValidator(
-        disabled_commands=disabled_commands or None
-    )
-    executor = CommandExecutor(security_validator=security_validator)
+    executor = _get_executor(tuple(disabled_commands), 30, Path.cwd())
 
     # Parse variables
-    variables = {}
-    if var:
-        for v in var if isinstance(var, list) else [var]:
-            if "=" in v:
-                key, value = v.split("=", 1)
-                variables[key.strip()] = value.strip()
+    raw_vars = var if isinstance(var, list) else ([var] if var else [])
+    variables = {
+        key.strip(): value.strip()
+        for key, sep, value in (v.partition("=") for v in raw_vars)
+        if sep
+    }
 
     console.print("Testing template:", style="bold")
     console.print("Template:")
@@ -114,15 +120,12 @@ def template_test(
     console.print("Current template testing is limited to command validation.")
 
     # For now, just validate any commands in the template
-    import re
-
-    commands = re.findall(r"\$\([^)]+\)|\{cmd:[^}]+\}|\{exec:[^}]+\}", template)
+    commands = list(_COMMAND_RE.finditer(template))
     if commands:
         console.print("Found commands:", style="yellow")
-        for cmd_placeholder in commands:
-            cmd = (
-                cmd_placeholder.strip("$(){}").replace("cmd:", "").replace("exec:", "")
-            )
+        for match in commands:
+            cmd_placeholder = match.group(0)
+            cmd = match.group("shell") or match.group("custom")
             if executor.is_command_allowed(cmd):
                 console.print(f"  {cmd_placeholder} → {cmd} [green]✓[/green]")
             else:
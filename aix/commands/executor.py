@@ -1,9 +1,24 @@
 import subprocess
 import re
-from typing import List, Tuple, Optional, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import groupby
+from typing import Callable, List, Tuple, Optional, Dict, Union
 from pathlib import Path
 from .base import Command, SecurityValidator
-from .security import DefaultSecurityValidator
+from .security import DefaultSecurityValidator, _split_command
+
+# Embedded command syntaxes: $(command), {cmd:command} and {exec:command}
+_COMMAND_RE = re.compile(r"\$\((?P<shell>[^)]+)\)|\{(?:cmd|exec):(?P<custom>[^}]+)\}")
+
+# Characters that need /bin/sh: pipes, redirects, expansions, globs, ...
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!=%\n")
+
+
+def _needs_shell(command: str) -> bool:
+    """Check whether a command uses shell syntax beyond plain arguments."""
+    return not _SHELL_CHARS.isdisjoint(command)
 
 
 class ShellCommand(Command):
@@ -19,20 +34,40 @@ class ShellCommand(Command):
     def execute(self, *args, **kwargs) -> Tuple[bool, str, str]:
         """Execute the shell command."""
         try:
-            result = subprocess.run(
-                self.command_string,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                cwd=self.working_dir,
-            )
+            result = None
+            if not _needs_shell(self.command_string):
+                # Plain argv: run it directly and skip the /bin/sh fork
+                try:
+                    argv = _split_command(self.command_string)
+                except ValueError:
+                    argv = ()
+                if argv:
+                    try:
+                        result = self._run(list(argv), shell=False)
+                    except OSError:
+                        # Shell builtin, missing binary or non-executable path:
+                        # let sh decide and report it
+                        pass
+            if result is None:
+                result = self._run(self.command_string, shell=True)
             return result.returncode == 0, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
             return False, "", f"Command timed out after {self.timeout} seconds"
         except Exception as e:
             return False, "", f"Error executing command: {str(e)}"
 
+    def _run(
+        self, args: Union[str, List[str]], shell: bool
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            args,
+            shell=shell,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            cwd=self.working_dir,
+        )
+
     def get_name(self) -> str:
         return self.command_string.split()[0] if self.command_string.strip() else ""
 
@@ -47,86 +82,108 @@ class IntelligentShellCommand(ShellCommand):
         self, command_string: str, working_dir: Optional[Path] = None, timeout: int = 30
     ):
         super().__init__(command_string, working_dir, timeout)
-        self.alternatives = self._build_alternatives()
+        # stderr of the failed run, which some alternatives depend on
+        self.last_error = ""
+
+    @cached_property
+    def alternatives(self) -> List[Tuple[str, str]]:
+        """Fallback commands, only built once the original command has failed."""
+        return self._build_alternatives(self.last_error)
 
     def execute(self, *args, **kwargs) -> Tuple[bool, str, str]:
         """Execute with intelligent fallbacks."""
         success, stdout, stderr = super().execute()
         if success:
             return success, stdout, stderr
-
-        # Try alternatives
-        for alt_command, reason in self.alternatives:
-            alt_cmd = ShellCommand(alt_command, self.working_dir, self.timeout)
-            success, stdout, stderr = alt_cmd.execute()
-            if success:
-                note = f"{stdout.strip()}\n[Note: Used '{alt_command}' instead of '{self.command_string}' ({reason})]"
-                return True, note, stderr
+        self.last_error = stderr
+
+        # Try alternatives in order; runs of read-only probes go concurrently
+        for is_probe, group in groupby(self.alternatives, key=_is_probe):
+            group = list(group)
+            if is_probe and len(group) > 1:
+                with ThreadPoolExecutor(max_workers=min(4, len(group))) as executor:
+                    results = list(executor.map(self._run_alternative, group))
+            else:
+                # Lazily, so nothing runs after the first success
+                results = map(self._run_alternative, group)
+
+            for (alt_command, reason), (success, stdout, stderr) in zip(group, results):
+                if success:
+                    note = f"{stdout.strip()}\n[Note: Used '{alt_command}' instead of '{self.command_string}' ({reason})]"
+                    return True, note, stderr
 
         return False, stdout, stderr
 
-    def _build_alternatives(self) -> List[Tuple[str, str]]:
+    def _run_alternative(self, alternative: Tuple[str, str]) -> Tuple[bool, str, str]:
+        return ShellCommand(alternative[0], self.working_dir, self.timeout).execute()
+
+    def _build_alternatives(self, error: str = "") -> List[Tuple[str, str]]:
         """Build intelligent alternatives for common commands."""
         cmd_parts = self.command_string.split()
         if not cmd_parts:
             return []
 
-        base_cmd = cmd_parts[0]
-        args = cmd_parts[1:] if len(cmd_parts) > 1 else []
-
-        alternatives = []
-
-        # Python alternatives
-        if base_cmd == "python":
-            alternatives.extend(
-                [
-                    (
-                        "python3 " + " ".join(args),
-                        "python3 commonly used instead of python",
-                    ),
-                    ("python3.12 " + " ".join(args), "trying specific Python version"),
-                    ("/usr/bin/python3 " + " ".join(args), "using full path"),
-                ]
-            )
+        handler = _ALTERNATIVES.get(cmd_parts[0])
+        if handler is None:
+            return []
+        return handler(" ".join(cmd_parts[1:]), error.lower())
 
-        # Git alternatives
-        elif base_cmd == "git":
-            if "not a git repository" in str(self):
-                alternatives.extend(
-                    [
-                        (
-                            "find . -name '.git' -type d 2>/dev/null | head -1",
-                            "finding git repositories",
-                        ),
-                        ("ls -la", "showing directory contents"),
-                    ]
-                )
-
-        # Node/npm alternatives
-        elif base_cmd in ["node", "npm"]:
-            alternatives.extend(
-                [
-                    ("which node || which nodejs", "checking for Node.js installation"),
-                    (
-                        "ls /usr/local/bin/node* 2>/dev/null || echo 'Node.js not found'",
-                        "looking for Node.js binaries",
-                    ),
-                ]
-            )
 
-        # Docker alternatives
-        elif base_cmd == "docker":
-            alternatives.extend(
-                [
-                    (
-                        "which docker || echo 'Docker not installed'",
-                        "checking Docker installation",
-                    ),
-                    ("podman " + " ".join(args), "trying Podman as alternative"),
-                ]
-            )
+# Alternatives starting with these only inspect the system, so they may run together
+_PROBE_COMMANDS = frozenset({"which", "whereis", "type", "echo", "ls", "find"})
 
-        return alternatives
+
+def _is_probe(alternative: Tuple[str, str]) -> bool:
+    parts = alternative[0].split(None, 1)
+    return bool(parts) and parts[0] in _PROBE_COMMANDS
+
+
+def _python_alternatives(args: str, error: str) -> List[Tuple[str, str]]:
+    return [
+        ("python3 " + args, "python3 commonly used instead of python"),
+        ("python3.12 " + args, "trying specific Python version"),
+        ("/usr/bin/python3 " + args, "using full path"),
+    ]
+
+
+def _git_alternatives(args: str, error: str) -> List[Tuple[str, str]]:
+    if "not a git repository" in error:
+        return [
+            (
+                "find . -name '.git' -type d 2>/dev/null | head -1",
+                "finding git repositories",
+            ),
+            ("ls -la", "showing directory contents"),
+        ]
+    return []
+
+
+def _node_alternatives(args: str, error: str) -> List[Tuple[str, str]]:
+    return [
+        ("which node || which nodejs", "checking for Node.js installation"),
+        (
+            "ls /usr/local/bin/node* 2>/dev/null || echo 'Node.js not found'",
+            "looking for Node.js binaries",
+        ),
+    ]
+
+
+def _docker_alternatives(args: str, error: str) -> List[Tuple[str, str]]:
+    return [
+        ("which docker || echo 'Docker not installed'", "checking Docker installation"),
+        ("podman " + args, "trying Podman as alternative"),
+    ]
+
+
+# Fallback builders for commonly missing commands, keyed by base command
+# Builders take the joined arguments and the lowercased stderr of the failed run
+_ALTERNATIVES: Dict[str, Callable[[str, str], List[Tuple[str, str]]]] = {
+    "python": _python_alternatives,
+    "git": _git_alternatives,
+    "node": _node_alternatives,
+    "npm": _node_alternatives,
+    "docker": _docker_alternatives,
+}
 
 
 class CommandExecutor:
@@ -137,10 +194,15 @@ class CommandExecutor:
         security_validator: Optional[SecurityValidator] = None,
         working_dir: Optional[Path] = None,
         timeout: int = 30,
+        cache_ttl: float = 5.0,
     ):
         self.security_validator = security_validator or DefaultSecurityValidator()
         self.working_dir = working_dir or Path.cwd()
         self.timeout = timeout
+        # Embedded command outputs reused across process_template calls for
+        # cache_ttl seconds; 0 disables the cache
+        self.cache_ttl = cache_ttl
+        self._output_cache: Dict[str, Tuple[float, str]] = {}
 
     def create_command(self, command_string: str, intelligent: bool = True) -> Command:
         """Factory method to create appropriate command instance."""
@@ -177,34 +239,44 @@ class CommandExecutor:
         Returns:
             Tuple of (processed_template, command_outputs)
         """
-        result = template
         command_outputs = {}
 
-        # First, substitute simple variables
-        for var_name, var_value in variables.items():
-            result = result.replace(f"{{{var_name}}}", var_value)
+        # First, substitute simple variables in a single pass
+        result = template
+        if variables and "{" in result:
+            var_re = re.compile(
+                "|".join(re.escape(f"{{{var_name}}}") for var_name in variables)
+            )
+            result = var_re.sub(lambda match: variables[match.group(0)[1:-1]], result)
 
-        # Process command patterns: $(command) and {cmd:command} and {exec:command}
-        command_patterns = [
-            (r"\$\(([^)]+)\)", "$(...)"),
-            (r"\{cmd:([^}]+)\}", "{cmd:...}"),
-            (r"\{exec:([^}]+)\}", "{exec:...}"),
-        ]
+        # Plain prompts have no command sigils, so skip the command machinery
+        if "$(" not in result and "{cmd:" not in result and "{exec:" not in result:
+            return result, command_outputs
+
+        def run_command(match: "re.Match[str]") -> str:
+            cmd = match.group("shell") or match.group("custom")
+            if cmd not in command_outputs:  # Avoid duplicate execution
+                command_outputs[cmd] = self._cached_output(cmd)
+            return command_outputs[cmd]
 
-        for pattern, placeholder_format in command_patterns:
-            matches = re.findall(pattern, result)
-            for cmd in matches:
-                if cmd not in command_outputs:  # Avoid duplicate execution
-                    success, stdout, stderr = self.execute(cmd)
-                    command_output = stdout if success else stderr
-                    command_outputs[cmd] = command_output.strip()
-
-                # Replace the command placeholder with actual output
-                if placeholder_format == "$(...)":
-                    result = result.replace(f"$({cmd})", command_outputs[cmd])
-                elif placeholder_format == "{cmd:...}":
-                    result = result.replace(f"{{cmd:{cmd}}}", command_outputs[cmd])
-                elif placeholder_format == "{exec:...}":
-                    result = result.replace(f"{{exec:{cmd}}}", command_outputs[cmd])
+        # Process command patterns: $(command) and {cmd:command} and {exec:command}
+        result = _COMMAND_RE.sub(run_command, result)
 
         return result, command_outputs
+
+    def _cached_output(self, cmd: str) -> str:
+        """Return a command's stripped output, reusing recent results."""
+        now = time.monotonic()
+        # Validate on every call so rule changes apply to cached commands too
+        if self.cache_ttl > 0 and self.is_command_allowed(cmd):
+            cached = self._output_cache.get(cmd)
+            if cached and now - cached[0] < self.cache_ttl:
+                return cached[1]
+
+        success, stdout, stderr = self.execute(cmd)
+        output = (stdout if success else stderr).strip()
+        if self.cache_ttl > 0:
+            if len(self._output_cache) >= 256:
+                self._output_cache.clear()
+            self._output_cache[cmd] = (now, output)
+        return output
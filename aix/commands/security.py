@@ -1,6 +1,7 @@
 import re
 import shlex
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from .base import SecurityValidator
 
 
@@ -64,48 +65,90 @@ class DefaultSecurityValidator(SecurityValidator):
 
     def is_allowed(self, command: str) -> bool:
         """Check if command is allowed to be executed."""
-        if not command.strip():
-            return False
-
-        try:
-            parsed = shlex.split(command)
-            if not parsed:
-                return False
-
-            base_command = parsed[0]
-            command_lower = command.lower().strip()
-
-            # Check disabled commands
-            for disabled in self.disabled_commands:
-                if base_command == disabled:
-                    return False
-                if base_command.startswith(disabled + " ") or base_command.startswith(
-                    disabled + "\t"
-                ):
-                    return False
-                if (
-                    disabled.endswith(" /")
-                    or disabled.startswith(":")
-                    or disabled == "."
-                ):
-                    if disabled in command_lower:
-                        return False
-
-            # Check dangerous patterns
-            for pattern in self.dangerous_patterns:
-                if re.search(pattern, command, re.IGNORECASE):
-                    return False
-
-            return True
-
-        except ValueError:
-            return False
+        return _is_allowed_cached(
+            command, tuple(self.disabled_commands), tuple(self.dangerous_patterns)
+        )
 
     def get_error_message(self, command: str) -> str:
         """Get error message for disallowed command."""
         return f"Command disabled for security: {command}"
 
 
+@lru_cache(maxsize=1024)
+def _is_allowed_cached(
+    command: str,
+    disabled_commands: Tuple[str, ...],
+    dangerous_patterns: Tuple[str, ...],
+) -> bool:
+    """Validate a command against the given rules, memoized per command string."""
+    if not command.strip():
+        return False
+
+    try:
+        parsed = _split_command(command)
+        if not parsed:
+            return False
+
+        base_command = parsed[0]
+        disabled, prefixes, substring_re, dangerous_re = _compile_rules(
+            disabled_commands, dangerous_patterns
+        )
+
+        # Check disabled commands
+        if base_command in disabled or base_command.startswith(prefixes):
+            return False
+        if substring_re is not None and substring_re.search(command.lower().strip()):
+            return False
+
+        # Check dangerous patterns
+        if dangerous_re is not None and dangerous_re.search(command):
+            return False
+
+        return True
+
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _split_command(command: str) -> Tuple[str, ...]:
+    """Tokenize a command the way the shell would, shared with the executor."""
+    # Without quoting or escapes shlex gives the same tokens as a plain split
+    if '"' not in command and "'" not in command and "\\" not in command:
+        return tuple(command.split())
+    return tuple(shlex.split(command))
+
+
+@lru_cache(maxsize=16)
+def _compile_rules(
+    disabled_commands: Tuple[str, ...], dangerous_patterns: Tuple[str, ...]
+) -> Tuple:
+    """Build the lookup structures used by _is_allowed_cached for a rule set."""
+    prefixes = tuple(
+        disabled + separator
+        for disabled in disabled_commands
+        for separator in (" ", "\t")
+    )
+    # Entries matched anywhere in the command, searched together in one pass
+    substrings = [
+        disabled
+        for disabled in disabled_commands
+        if disabled.endswith(" /") or disabled.startswith(":") or disabled == "."
+    ]
+    substring_re = (
+        re.compile("|".join(map(re.escape, substrings))) if substrings else None
+    )
+    dangerous_re = (
+        re.compile(
+            "|".join(f"(?:{pattern})" for pattern in dangerous_patterns),
+            re.IGNORECASE,
+        )
+        if dangerous_patterns
+        else None
+    )
+    return frozenset(disabled_commands), prefixes, substring_re, dangerous_re
+
+
 class CompositeSecurityValidator(SecurityValidator):
     """Composite validator that combines multiple security validators."""
 
@@ -3,14 +3,89 @@ Autocompletion support for Typer CLI commands.
 Provides dynamic completion for prompt names, variables, providers, and models.
 """
 
-from typing import List
-from .storage import PromptStorage
-from .config import Config
+from bisect import bisect_left
+from itertools import islice, takewhile
+from typing import List, Tuple
+
+# Fixed completion candidates; the *_SORTED copies allow prefix lookup by bisection
+_OPENROUTER_MODELS = (
+    "meta-llama/llama-3.2-3b-instruct:free",
+    "meta-llama/llama-3.2-1b-instruct:free",
+    "meta-llama/llama-3.1-8b-instruct:free",
+    "mistralai/mistral-7b-instruct:free",
+    "microsoft/phi-3-mini-128k-instruct:free",
+    "meta-llama/llama-3.1-70b-instruct",
+    "meta-llama/llama-3.1-405b-instruct",
+    "anthropic/claude-3-sonnet",
+    "anthropic/claude-3-opus",
+    "anthropic/claude-3-haiku",
+    "openai/gpt-4",
+    "openai/gpt-4-turbo",
+    "openai/gpt-3.5-turbo",
+    "google/gemini-pro",
+    "mistralai/mistral-large",
+    "cohere/command-r-plus",
+)
+_OPENROUTER_MODELS_SORTED = tuple(sorted(_OPENROUTER_MODELS))
+
+_OPENAI_MODELS = (
+    "gpt-4",
+    "gpt-4-turbo",
+    "gpt-4-0125-preview",
+    "gpt-3.5-turbo",
+    "gpt-3.5-turbo-0125",
+)
+_OPENAI_MODELS_SORTED = tuple(sorted(_OPENAI_MODELS))
+
+_ANTHROPIC_MODELS = (
+    "claude-3-opus-20240229",
+    "claude-3-sonnet-20240229",
+    "claude-3-haiku-20240307",
+    "claude-2.1",
+    "claude-2.0",
+)
+_ANTHROPIC_MODELS_SORTED = tuple(sorted(_ANTHROPIC_MODELS))
+
+_COMMON_VARIABLES = (
+    "language=",
+    "code=",
+    "file=",
+    "project=",
+    "description=",
+    "input=",
+    "output=",
+    "type=",
+    "format=",
+    "style=",
+)
+_COMMON_VARIABLES_SORTED = tuple(sorted(_COMMON_VARIABLES))
+
+_CONFIG_KEYS = (
+    "storage_path",
+    "editor",
+    "default_provider",
+    "max_tokens",
+    "temperature",
+)
+_CONFIG_KEYS_SORTED = tuple(sorted(_CONFIG_KEYS))
+
+
+def _filter_prefix(sorted_choices: Tuple[str, ...], incomplete: str) -> List[str]:
+    """Return the entries of a sorted tuple that start with the given prefix."""
+    start = bisect_left(sorted_choices, incomplete)
+    return list(
+        takewhile(
+            lambda choice: choice.startswith(incomplete),
+            islice(sorted_choices, start, None),
+        )
+    )
 
 
 def complete_prompt_names(incomplete: str) -> List[str]:
     """Complete prompt names from stored prompts."""
     try:
+        from .storage import PromptStorage
+
         storage = PromptStorage()
         prompts = storage.list_prompts()
         names = [prompt.name for prompt in prompts]
@@ -30,7 +105,9 @@ def complete_providers(incomplete: str) -> List[str]:
 
     # Add custom providers
     try:
-        config = Config()
+        from .config import get_config
+
+        config = get_config()
         custom_providers = config.get_custom_providers()
         custom_provider_names = [f"custom:{name}" for name in custom_providers.keys()]
         providers.extend(custom_provider_names)
@@ -45,61 +122,23 @@ def complete_providers(incomplete: str) -> List[str]:
 
 def complete_openrouter_models(incomplete: str) -> List[str]:
     """Complete OpenRouter model names."""
-    models = [
-        "meta-llama/llama-3.2-3b-instruct:free",
-        "meta-llama/llama-3.2-1b-instruct:free",
-        "meta-llama/llama-3.1-8b-instruct:free",
-        "mistralai/mistral-7b-instruct:free",
-        "microsoft/phi-3-mini-128k-instruct:free",
-        "meta-llama/llama-3.1-70b-instruct",
-        "meta-llama/llama-3.1-405b-instruct",
-        "anthropic/claude-3-sonnet",
-        "anthropic/claude-3-opus",
-        "anthropic/claude-3-haiku",
-        "openai/gpt-4",
-        "openai/gpt-4-turbo",
-        "openai/gpt-3.5-turbo",
-        "google/gemini-pro",
-        "mistralai/mistral-large",
-        "cohere/command-r-plus",
-    ]
-
     if incomplete:
-        models = [m for m in models if m.startswith(incomplete)]
-
-    return models
+        return _filter_prefix(_OPENROUTER_MODELS_SORTED, incomplete)
+    return list(_OPENROUTER_MODELS)
 
 
 def complete_openai_models(incomplete: str) -> List[str]:
     """Complete OpenAI model names."""
-    models = [
-        "gpt-4",
-        "gpt-4-turbo",
-        "gpt-4-0125-preview",
-        "gpt-3.5-turbo",
-        "gpt-3.5-turbo-0125",
-    ]
-
     if incomplete:
-        models = [m for m in models if m.startswith(incomplete)]
-
-    return models
+        return _filter_prefix(_OPENAI_MODELS_SORTED, incomplete)
+    return list(_OPENAI_MODELS)
 
 
 def complete_anthropic_models(incomplete: str) -> List[str]:
     """Complete Anthropic model names."""
-    models = [
-        "claude-3-opus-20240229",
-        "claude-3-sonnet-20240229",
-        "claude-3-haiku-20240307",
-        "claude-2.1",
-        "claude-2.0",
-    ]
-
     if incomplete:
-        models = [m for m in models if m.startswith(incomplete)]
-
-    return models
+        return _filter_prefix(_ANTHROPIC_MODELS_SORTED, incomplete)
+    return list(_ANTHROPIC_MODELS)
 
 
 def complete_models(incomplete: str) -> List[str]:
@@ -113,44 +152,23 @@ def complete_prompt_variables(incomplete: str) -> List[str]:
     """Complete variable names in key=value format."""
     # For now, just return some common variable patterns
     # This could be enhanced to be context-aware in the future
-    common_vars = [
-        "language=",
-        "code=",
-        "file=",
-        "project=",
-        "description=",
-        "input=",
-        "output=",
-        "type=",
-        "format=",
-        "style=",
-    ]
-
     if incomplete:
-        return [var for var in common_vars if var.startswith(incomplete)]
-
-    return common_vars
+        return _filter_prefix(_COMMON_VARIABLES_SORTED, incomplete)
+    return list(_COMMON_VARIABLES)
 
 
 def complete_config_keys(incomplete: str) -> List[str]:
     """Complete configuration key names."""
-    keys = [
-        "storage_path",
-        "editor",
-        "default_provider",
-        "max_tokens",
-        "temperature",
-    ]
-
     if incomplete:
-        keys = [k for k in keys if k.startswith(incomplete)]
-
-    return keys
+        return _filter_prefix(_CONFIG_KEYS_SORTED, incomplete)
+    return list(_CONFIG_KEYS)
 
 
 def complete_tags(incomplete: str) -> List[str]:
     """Complete tag names from existing prompts."""
     try:
+        from .storage import PromptStorage
+
         storage = PromptStorage()
         prompts = storage.list_prompts()
 
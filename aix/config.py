@@ -1,27 +1,43 @@
 import json
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Raw config file bytes by path, reused while their (mtime_ns, size) is unchanged;
+# each load parses its own copy, which is cheaper than deep-copying a shared one
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _default_config_path() -> Path:
+    """Resolve config.json from AIX_STORAGE_PATH, falling back to ~/.prompts."""
+    # Check environment variable first for storage path
+    env_path = os.environ.get("AIX_STORAGE_PATH")
+    if env_path:
+        return Path(env_path) / "config.json"
+    return Path.home() / ".prompts" / "config.json"
 
 
 class Config:
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize configuration manager."""
-        if config_path:
-            self.config_path = config_path
-        else:
-            # Check environment variable first for storage path
-            env_path = os.environ.get("AIX_STORAGE_PATH")
-            if env_path:
-                self.config_path = Path(env_path) / "config.json"
-            else:
-                self.config_path = Path.home() / ".prompts" / "config.json"
+        self.config_path = config_path or _default_config_path()
         self.config_path.parent.mkdir(exist_ok=True)
-        self._settings = self._load_config()
+        # Existing settings are parsed on first use; a missing file is still
+        # created with defaults right away
+        if not self.config_path.exists():
+            self._settings = self._load_config()
+
+    @cached_property
+    def _settings(self) -> Dict[str, Any]:
+        """Settings loaded from disk the first time they are needed."""
+        return self._load_config()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             # Create default config
             default_config = {
                 "storage_path": str(Path.home() / ".prompts"),
@@ -37,21 +53,33 @@ class Config:
             self._save_config(default_config)
             return default_config
 
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(self.config_path)
         try:
-            with open(self.config_path, "r") as f:
-                config = json.load(f)
-                return config
+            if cached and cached[0] == signature:
+                return json.loads(cached[1])
+            data = self.config_path.read_bytes()
+            config = json.loads(data)
         except Exception as e:
             print(f"Error loading config: {e}")
             return {}
+        _CONFIG_CACHE[self.config_path] = (signature, data)
+        return config
 
     def _save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to file."""
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            # Swap in a complete file with one rename; a crash mid-write must
+            # not leave a truncated config.json behind
+            tmp_path = self.config_path.with_name(f"{self.config_path.name}.tmp")
+            data = json.dumps(config, indent=2).encode("utf-8")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.config_path)
+            stat = self.config_path.stat()
+            _CONFIG_CACHE[self.config_path] = ((stat.st_mtime_ns, stat.st_size), data)
             return True
         except Exception as e:
+            _CONFIG_CACHE.pop(self.config_path, None)
             print(f"Error saving config: {e}")
             return False
 
@@ -79,6 +107,7 @@ class Config:
         """Reset configuration to defaults."""
         if self.config_path.exists():
             self.config_path.unlink()
+        _CONFIG_CACHE.pop(self.config_path, None)
         self._settings = self._load_config()
         return True
 
@@ -228,6 +257,25 @@ class Config:
         """Set the list of disabled commands."""
         return self.set("disabled_commands", commands)
 
+    def update_disabled_commands(
+        self, add: Iterable[str] = (), remove: Iterable[str] = ()
+    ) -> bool:
+        """Add and remove several disabled commands with a single config save."""
+        disabled = self.get_disabled_commands()
+        remove = set(remove)
+
+        # Removals are applied first, existing order is preserved
+        updated = [command for command in disabled if command not in remove]
+        present = set(updated)
+        for command in add:
+            if command not in present:
+                present.add(command)
+                updated.append(command)
+
+        if updated == disabled:
+            return True
+        return self.set_disabled_commands(updated)
+
     def add_disabled_command(self, command: str) -> bool:
         """Add a command to the disabled list."""
         disabled = self.get_disabled_commands()
@@ -243,3 +291,30 @@ class Config:
             disabled.remove(command)
             return self.set_disabled_commands(disabled)
         return False
+
+
+# Config instances shared by get_config(), keyed like _CONFIG_CACHE
+_SHARED_CONFIGS: Dict[Path, Tuple[Tuple[int, int], Config]] = {}
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_config(config_path: Optional[Path] = None) -> Config:
+    """Return a shared Config for the path, replaced once the file changes on disk."""
+    config_path = config_path or _default_config_path()
+    signature = _stat_signature(config_path)
+    shared = _SHARED_CONFIGS.get(config_path)
+    if shared is not None and signature is not None and shared[0] == signature:
+        return shared[1]
+
+    config = Config(config_path)
+    signature = _stat_signature(config_path)
+    if signature is not None:
+        _SHARED_CONFIGS[config_path] = (signature, config)
+    return config
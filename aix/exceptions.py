@@ -88,6 +88,7 @@ def parse_api_error(response, provider: str) -> AIXError:
         message = f"HTTP {status_code}: {response.text[:200]}"
 
     # Map status codes and error types to specific exceptions
+    message_lower = message.lower()
     if status_code == 401:
         return AuthenticationError(
             f"Invalid API key for {provider}. Please check your API key configuration.",
@@ -97,10 +98,10 @@ def parse_api_error(response, provider: str) -> AIXError:
 
     elif (
         status_code == 402
-        or "insufficient" in message.lower()
-        or "balance" in message.lower()
-        or "usd" in message.lower()
-        or "diem" in message.lower()
+        or "insufficient" in message_lower
+        or "balance" in message_lower
+        or "usd" in message_lower
+        or "diem" in message_lower
     ):
         return InsufficientCreditsError(
             f"Insufficient credits for {provider}. Please add credits to your account.",
@@ -108,7 +109,7 @@ def parse_api_error(response, provider: str) -> AIXError:
             status_code=status_code,
         )
 
-    elif status_code == 429 or "rate limit" in message.lower():
+    elif status_code == 429 or "rate limit" in message_lower:
         return RateLimitError(
             f"Rate limit exceeded for {provider}. Please wait and try again.",
             provider=provider,
@@ -117,8 +118,8 @@ def parse_api_error(response, provider: str) -> AIXError:
 
     elif (
         status_code == 404
-        or "not found" in message.lower()
-        or "no endpoints" in message.lower()
+        or "not found" in message_lower
+        or "no endpoints" in message_lower
     ):
         return ModelNotFoundError(
             f"Model not available on {provider}. Try a different model or check the provider's available models.",
@@ -1,8 +1,13 @@
 import os
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Set
 from .template import PromptTemplate
 
+if TYPE_CHECKING:
+    from .collection import CollectionStorage
+
 
 class PromptStorage:
     """Collections-only storage system. All templates are stored within collections."""
@@ -27,33 +32,39 @@ class PromptStorage:
         # Ensure default collection exists
         self._ensure_default_collection()
 
+    @cached_property
+    def _collection_storage(self) -> "CollectionStorage":
+        """Collection storage shared by all lookups on this instance."""
+        from .collection import CollectionStorage
+
+        return CollectionStorage(self.storage_path)
+
     def _ensure_default_collection(self):
         """Ensure the default collection exists for ungrouped templates."""
-        from .collection import CollectionStorage, Collection
-        from datetime import datetime
+        from .collection import Collection
 
-        collection_storage = CollectionStorage(self.storage_path)
+        collection_storage = self._collection_storage
         if not collection_storage.collection_exists(self.DEFAULT_COLLECTION):
+            now = datetime.now().isoformat()
             default_collection = Collection(
                 name=self.DEFAULT_COLLECTION,
                 description="Default collection for ungrouped templates",
                 templates=[],
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
+                created_at=now,
+                updated_at=now,
             )
             collection_storage.save_collection(default_collection)
 
     def _get_collection_for_template(self, template_name: str) -> Optional[str]:
         """Find which collection contains the given template."""
-        from .collection import CollectionStorage
+        from .collection import _list_xml_stems
 
-        collection_storage = CollectionStorage(self.storage_path)
+        collection_storage = self._collection_storage
 
         # Check all collections for the template
-        for collection_xml in self.collections_path.glob("*.xml"):
-            collection_name = collection_xml.stem
+        for collection_name in _list_xml_stems(self.collections_path):
             collection = collection_storage.get_collection(collection_name)
-            if collection and template_name in collection.templates:
+            if collection and collection.has_template(template_name):
                 return collection_name
         return None
 
@@ -63,14 +74,21 @@ class PromptStorage:
 
     def save_prompt_xml(self, prompt: PromptTemplate, collection: str = None) -> bool:
         """Save a prompt template to a collection as XML."""
+        return self.save_prompts_batch([prompt], collection)
+
+    def save_prompts_batch(
+        self, prompts: List[PromptTemplate], collection: str = None
+    ) -> bool:
+        """Save several prompt templates to a collection, writing its XML once."""
         try:
             # Use default collection if none specified
             target_collection = collection or self.DEFAULT_COLLECTION
 
             # Remove from any existing collection first
-            existing_collection = self._get_collection_for_template(prompt.name)
-            if existing_collection and existing_collection != target_collection:
-                self.delete_prompt(prompt.name)
+            for prompt in prompts:
+                existing_collection = self._get_collection_for_template(prompt.name)
+                if existing_collection and existing_collection != target_collection:
+                    self.delete_prompt(prompt.name)
 
             from .collection import CollectionManager
 
@@ -84,8 +102,8 @@ class PromptStorage:
                 else "",
             )
 
-            # Add template to collection (this will save it as an embedded template)
-            return manager.add_template_to_collection(target_collection, prompt)
+            # Add templates to collection (this will save them as embedded templates)
+            return manager.add_templates_to_collection(target_collection, prompts)
 
         except Exception as e:
             print(f"Error saving XML prompt: {e}")
@@ -99,8 +117,9 @@ class PromptStorage:
 
         # Search all collections for the template
         if self.collections_path.exists():
-            for collection_xml in self.collections_path.glob("*.xml"):
-                collection_name = collection_xml.stem
+            from .collection import _list_xml_stems
+
+            for collection_name in _list_xml_stems(self.collections_path):
                 prompt = self._get_prompt_from_collection_xml(name, collection_name)
                 if prompt:
                     return prompt
@@ -112,10 +131,9 @@ class PromptStorage:
     ) -> Optional[PromptTemplate]:
         """Load a prompt template from collection XML file."""
         try:
-            from .collection import CollectionStorage
-
-            collection_storage = CollectionStorage(self.storage_path)
-            return collection_storage.get_xml_collection_template(collection, name)
+            return self._collection_storage.get_xml_collection_template(
+                collection, name
+            )
         except Exception as e:
             print(f"Error loading prompt {name} from collection {collection}: {e}")
             return None
@@ -127,12 +145,11 @@ class PromptStorage:
 
         # Check all collections for templates
         if self.collections_path.exists():
-            from .collection import CollectionStorage
+            from .collection import _list_xml_stems
 
-            collection_storage = CollectionStorage(self.storage_path)
+            collection_storage = self._collection_storage
 
-            for collection_xml in self.collections_path.glob("*.xml"):
-                collection_name = collection_xml.stem
+            for collection_name in _list_xml_stems(self.collections_path):
                 collection = collection_storage.get_collection(collection_name)
                 if collection:
                     for template_name in collection.templates:
@@ -148,6 +165,26 @@ class PromptStorage:
 
         return sorted(prompts, key=lambda p: p.name)
 
+    def list_prompt_names(self) -> Set[str]:
+        """List the names of all templates across collections without loading them.
+
+        Only reads collection files, unlike list_collections() which also
+        refreshes the index and migrates legacy collections.
+        """
+        from .collection import _list_xml_stems, _read_xml_collection_data
+
+        names: Set[str] = set()
+        for collection_name in _list_xml_stems(self.collections_path):
+            try:
+                data = _read_xml_collection_data(
+                    self.collections_path / f"{collection_name}.xml"
+                )
+            except Exception:
+                continue
+            if data:
+                names.update(data["templates"])
+        return names
+
     def delete_prompt(self, name: str, collection: str = None) -> bool:
         """Delete a prompt template from collections."""
         if collection:
@@ -188,8 +225,9 @@ class PromptStorage:
         else:
             # Search all collections
             if self.collections_path.exists():
-                for collection_xml in self.collections_path.glob("*.xml"):
-                    collection_name = collection_xml.stem
+                from .collection import _list_xml_stems
+
+                for collection_name in _list_xml_stems(self.collections_path):
                     if self._get_prompt_from_collection_xml(name, collection_name):
                         return True
         return False
@@ -204,9 +242,11 @@ class PromptStorage:
 
         # Collections directory XML files only
         if self.collections_path.exists():
-            for f in self.collections_path.glob("*.xml"):
-                total_size += f.stat().st_size
-                collections_count += 1
+            with os.scandir(self.collections_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".xml") and entry.is_file():
+                        total_size += entry.stat().st_size
+                        collections_count += 1
 
         return {
             "storage_path": str(self.storage_path),
@@ -1,3 +1,5 @@
+import os
+
 from aix.collection import Collection, CollectionStorage, CollectionManager
 from aix.storage import PromptStorage
 from aix.template import PromptTemplate
@@ -60,6 +62,11 @@ class TestCollection:
         assert collection.has_template("prompt2") is True
         assert collection.has_template("prompt3") is False
 
+        # Replacing the template list keeps membership checks in sync
+        collection.templates = ["prompt3"]
+        assert collection.has_template("prompt3") is True
+        assert collection.has_template("prompt1") is False
+
     def test_collection_serialization(self):
         """Test collection serialization to/from dict."""
         collection = Collection(
@@ -139,6 +146,23 @@ class TestCollectionStorage:
         assert retrieved is not None
         assert "test-template" in retrieved.templates
 
+    def test_save_collection_with_placeholder_like_text(self, temp_storage_dir):
+        """Test that user text resembling a CDATA placeholder is saved verbatim."""
+        collection_storage = CollectionStorage(temp_storage_dir)
+        prompt_storage = PromptStorage(temp_storage_dir)
+
+        description = "desc __AIX_CDATA_0__ __AIX_CDATA_7__"
+        assert collection_storage.save_collection(Collection("c2", description))
+        template = PromptTemplate("t", "Body", description="__AIX_CDATA_0__")
+        assert prompt_storage.save_prompt_xml(template, "c2") is True
+
+        loaded = collection_storage.get_collection("c2")
+        assert loaded.description == description
+        assert loaded.templates == ["t"]
+        loaded_template = prompt_storage.get_prompt("t", "c2")
+        assert loaded_template.template == "Body"
+        assert loaded_template.description == "__AIX_CDATA_0__"
+
     def test_list_collections(self, temp_storage_dir):
         """Test listing all collections."""
         storage = CollectionStorage(temp_storage_dir)
@@ -162,6 +186,98 @@ class TestCollectionStorage:
         assert "collection2" in names
         assert "collection3" in names
 
+    def test_list_collections_uses_index(self, temp_storage_dir):
+        """Test that list_collections caches metadata and notices changes."""
+        storage = CollectionStorage(temp_storage_dir)
+        storage.save_collection(Collection("indexed", "Original description"))
+
+        listed = storage.list_collections()
+        assert storage.collection_index_file.exists()
+        assert listed[0].description == "Original description"
+
+        # Rewriting the XML file invalidates the cached entry
+        storage.save_collection(Collection("indexed", "Updated description, longer"))
+        listed = storage.list_collections()
+        assert listed[0].description == "Updated description, longer"
+
+        # Deleted collections drop out of the listing
+        storage.delete_collection("indexed")
+        assert storage.list_collections() == []
+
+    def test_list_collections_index_same_size_rewrite(self, temp_storage_dir):
+        """Test that a rewrite keeping size and mtime does not return stale data."""
+        storage = CollectionStorage(temp_storage_dir)
+        storage.save_collection(Collection("indexed", "Description AAAA"))
+        xml_path = storage.collections_path / "indexed.xml"
+        before = os.stat(xml_path)
+
+        assert storage.list_collections()[0].description == "Description AAAA"
+
+        # Same-length rewrite with the timestamp pinned to the old value
+        storage.save_collection(Collection("indexed", "Description BBBB"))
+        os.utime(xml_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert os.stat(xml_path).st_size == before.st_size
+
+        assert storage.list_collections()[0].description == "Description BBBB"
+
+    def test_parsed_xml_is_cached_until_saved(self, temp_storage_dir):
+        """Test that collection XML is parsed once until the file is rewritten."""
+        from aix.collection import _stream_collection_data
+
+        storage = CollectionStorage(temp_storage_dir)
+        storage.save_collection(Collection("cached", "Before"))
+
+        storage.get_collection_from_xml("cached")
+        hits = _stream_collection_data.cache_info().hits
+        assert storage.get_collection_from_xml("cached").description == "Before"
+        assert _stream_collection_data.cache_info().hits == hits + 1
+
+        # Mutating a returned collection does not leak into the cache
+        storage.get_collection_from_xml("cached").tags.append("mutated")
+        assert storage.get_collection_from_xml("cached").tags == []
+
+        # Saving clears the cache so the new content is read back
+        storage.save_collection(Collection("cached", "After"))
+        assert storage.get_collection_from_xml("cached").description == "After"
+
+    def test_get_collection_ignores_empty_legacy_directory(self, temp_storage_dir):
+        """Test that an empty legacy directory does not wipe embedded templates."""
+        collection_storage = CollectionStorage(temp_storage_dir)
+        prompt_storage = PromptStorage(temp_storage_dir)
+
+        collection_storage.save_collection(Collection("mixed", templates=[]))
+        prompt_storage.save_prompt_xml(PromptTemplate("kept", "Body"), "mixed")
+        (collection_storage.collections_path / "mixed").mkdir()
+
+        assert collection_storage.get_collection("mixed").templates == ["kept"]
+        assert collection_storage.get_collection_from_xml("mixed").templates == ["kept"]
+
+    def test_migrate_legacy_collections(self, temp_storage_dir):
+        """Test migrating legacy directory-based collections to XML."""
+        storage = CollectionStorage(temp_storage_dir)
+
+        for name in ("legacy1", "legacy2"):
+            legacy_dir = storage.collections_path / name
+            legacy_dir.mkdir()
+            (legacy_dir / f"{name}-template.xml").write_text("<template/>")
+        (storage.collections_path / "empty-legacy").mkdir()
+
+        # Directories that already have an XML collection are left alone
+        storage.save_collection(Collection("kept", "Existing collection"))
+        kept_dir = storage.collections_path / "kept"
+        kept_dir.mkdir()
+        (kept_dir / "kept-template.xml").write_text("<template/>")
+
+        storage._migrate_legacy_collections()
+
+        assert storage.get_collection("kept").description == "Existing collection"
+
+        for name in ("legacy1", "legacy2"):
+            migrated = storage.get_collection(name)
+            assert migrated is not None
+            assert migrated.templates == [f"{name}-template"]
+        assert storage.collection_exists("empty-legacy") is False
+
     def test_collection_exists(self, temp_storage_dir):
         """Test checking if collection exists."""
         storage = CollectionStorage(temp_storage_dir)
@@ -201,6 +317,11 @@ class TestCollectionStorage:
         current = storage.get_current_collection()
         assert current == "current-collection"
 
+        # A change made through another instance is picked up
+        storage.save_collection(Collection("other"))
+        assert CollectionStorage(temp_storage_dir).set_current_collection("other")
+        assert storage.get_current_collection() == "other"
+
         # Clear current
         success = storage.clear_current_collection()
         assert success is True
@@ -234,6 +355,45 @@ class TestCollectionStorage:
         assert "prompt1" in template_names
         assert "prompt2" in template_names
 
+    def test_iter_collection_templates(self, temp_storage_dir):
+        """Test lazily iterating a collection's templates."""
+        collection_storage = CollectionStorage(temp_storage_dir)
+        prompt_storage = PromptStorage(temp_storage_dir)
+
+        prompt_storage.save_prompts_batch(
+            [PromptTemplate(f"lazy{i}", f"Template {i}") for i in range(3)],
+            "lazy-collection",
+        )
+
+        templates = collection_storage.iter_collection_templates("lazy-collection")
+        first = next(templates)
+        assert first.name == "lazy0"
+        assert first.template == "Template 0"
+        templates.close()
+
+        assert list(collection_storage.iter_collection_templates("missing")) == []
+
+    def test_get_all_xml_collection_templates(self, temp_storage_dir):
+        """Test loading every embedded template from an XML collection."""
+        collection_storage = CollectionStorage(temp_storage_dir)
+        prompt_storage = PromptStorage(temp_storage_dir)
+
+        collection_storage.save_collection(Collection(name="bulk-collection"))
+        prompt_storage.save_prompt_xml(
+            PromptTemplate("bulk1", "First {topic}"), "bulk-collection"
+        )
+        prompt_storage.save_prompt_xml(
+            PromptTemplate("bulk2", "Second template"), "bulk-collection"
+        )
+
+        templates = collection_storage.get_all_xml_collection_templates(
+            "bulk-collection"
+        )
+
+        assert [t.name for t in templates] == ["bulk1", "bulk2"]
+        assert templates[0].template == "First {topic}"
+        assert collection_storage.get_all_xml_collection_templates("missing") == []
+
     def test_validate_collection_templates(self, temp_storage_dir):
         """Test validation of collection templates."""
         collection_storage = CollectionStorage(temp_storage_dir)
@@ -302,6 +462,17 @@ class TestCollectionManager:
         current = manager.collection_storage.get_current_collection()
         assert current == "load-test"
 
+    def test_get_template_collection(self, temp_storage_dir):
+        """Test finding which collection holds a template."""
+        manager = CollectionManager(temp_storage_dir)
+        manager.create_collection("owner")
+        manager.add_template_to_collection(
+            "owner", PromptTemplate("owned", "Owned {thing}")
+        )
+
+        assert manager.get_template_collection("owned") == "owner"
+        assert manager.get_template_collection("unknown") is None
+
     def test_add_template_to_current_collection(self, temp_storage_dir):
         """Test adding templates to current collection."""
         manager = CollectionManager(temp_storage_dir)
@@ -321,6 +492,27 @@ class TestCollectionManager:
         collection = manager.collection_storage.get_collection("add-test")
         assert "test-prompt" in collection.templates
 
+    def test_add_templates_to_current_collection(self, temp_storage_dir):
+        """Test adding several templates to the current collection at once."""
+        manager = CollectionManager(temp_storage_dir)
+        manager.prompt_storage.save_prompts_batch(
+            [PromptTemplate("bulk1", "One"), PromptTemplate("bulk2", "Two")]
+        )
+
+        manager.create_collection("bulk-test")
+        manager.load_collection("bulk-test")
+
+        success = manager.add_templates_to_current_collection(
+            ["bulk1", "bulk2", "does-not-exist"]
+        )
+        assert success is True
+
+        collection = manager.collection_storage.get_collection("bulk-test")
+        assert collection.templates == ["bulk1", "bulk2"]
+
+        # Nothing new to add
+        assert manager.add_templates_to_current_collection(["bulk1"]) is False
+
     def test_remove_template_from_current_collection(self, temp_storage_dir):
         """Test removing templates from current collection."""
         manager = CollectionManager(temp_storage_dir)
@@ -401,3 +593,44 @@ class TestCollectionManager:
         assert result["collection_name"] == "export-test"
         # Templates might be imported with different naming, check for basic success
         assert isinstance(result["imported_templates"], list)
+
+    def test_import_bundle_with_template_files(self, temp_storage_dir):
+        """Test bundle members are written straight to their destinations."""
+        import io
+        import json
+        import tarfile
+
+        manager = CollectionManager(temp_storage_dir)
+        manager.prompt_storage.save_prompt(PromptTemplate("existing", "Old"))
+
+        bundle = temp_storage_dir / "bundled-bundle.tar.gz"
+        members = [
+            ("bundled.xml", b"<collection><name>bundled</name></collection>"),
+            ("manifest.json", json.dumps({"collection_name": "bundled"}).encode()),
+            ("templates/fresh.txt", b"Fresh content"),
+            ("templates/fresh.yaml", b"name: fresh\n"),
+            ("templates/existing.yaml", b"name: existing\n"),
+            ("templates/existing.txt", b"New content"),
+            ("templates/orphan.txt", b"No metadata"),
+        ]
+        with tarfile.open(bundle, "w:gz") as tar:
+            for name, data in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        result = manager.import_collection(bundle)
+
+        assert result["success"] is True
+        assert result["collection_name"] == "bundled"
+        assert result["imported_templates"] == ["fresh"]
+        assert result["skipped_templates"] == ["existing"]
+        assert manager.collection_storage.collection_exists("bundled")
+        assert (temp_storage_dir / "fresh.txt").read_bytes() == b"Fresh content"
+        assert not (temp_storage_dir / "existing.txt").exists()
+        assert not (temp_storage_dir / "orphan.txt").exists()
+
+        # Importing again without overwrite is refused
+        result = manager.import_collection(bundle)
+        assert result["success"] is False
+        assert "already exists" in result["errors"][0]
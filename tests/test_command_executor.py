@@ -52,6 +52,21 @@ class TestCommandExecutor:
         assert executor.is_command_allowed("dangerous command") is False
         assert executor.is_command_allowed("") is False
 
+    def test_is_command_allowed_after_rules_change(self):
+        """Test that edits to the validator's rule lists take effect."""
+        from aix.commands import DefaultSecurityValidator
+
+        security_validator = DefaultSecurityValidator(disabled_commands=["rm"])
+        executor = CommandExecutor(security_validator=security_validator)
+
+        assert executor.is_command_allowed("git status") is True
+        security_validator.disabled_commands.append("git")
+        assert executor.is_command_allowed("git status") is False
+
+        assert executor.is_command_allowed("eval echo hi") is False
+        security_validator.dangerous_patterns = []
+        assert executor.is_command_allowed("eval echo hi") is True
+
     def test_execute_allowed_command(self):
         """Test executing an allowed command."""
         from aix.commands import DefaultSecurityValidator
@@ -142,3 +157,90 @@ class TestCommandExecutor:
 
         assert success is False
         assert "Command disabled for security" in stderr
+
+    def test_process_template(self):
+        """Test variables are substituted before embedded commands run."""
+        executor = CommandExecutor()
+
+        result, outputs = executor.process_template(
+            "{greeting}: $(echo {name}) / {cmd:echo {name}} / {missing}",
+            {"greeting": "hi", "name": "bob"},
+        )
+
+        assert result == "hi: bob / bob / {missing}"
+        assert outputs == {"echo bob": "bob"}
+
+    def test_execute_without_shell_falls_back_for_builtins(self):
+        """Test plain commands run directly and shell builtins still work."""
+        executor = CommandExecutor()
+
+        success, stdout, _ = executor.execute("echo 'a  b'", intelligent=False)
+        assert success is True
+        assert stdout == "a  b\n"
+
+        success, _, _ = executor.execute("cd /", intelligent=False)
+        assert success is True
+
+    def test_execute_without_shell_reports_non_executable_like_sh(self, tmp_path):
+        """Test non-executable paths are reported by sh, not as a Python error."""
+        (tmp_path / "somedir").mkdir()
+        executor = CommandExecutor(working_dir=tmp_path)
+
+        success, _, stderr = executor.execute("./somedir", intelligent=False)
+        assert success is False
+        assert "Error executing command" not in stderr
+        assert "somedir" in stderr
+
+    def test_process_template_reuses_recent_outputs(self, tmp_path):
+        """Test embedded command outputs are cached for cache_ttl seconds."""
+        counter = tmp_path / "count"
+        template = f"$(echo x >> {counter}; wc -l < {counter})"
+
+        executor = CommandExecutor(working_dir=tmp_path)
+        first, _ = executor.process_template(template, {})
+        second, _ = executor.process_template(template, {})
+        assert first == second == "1"
+
+        uncached = CommandExecutor(working_dir=tmp_path, cache_ttl=0)
+        assert uncached.process_template(template, {})[0] == "2"
+
+    def test_cached_outputs_respect_rule_changes(self):
+        """Test a command disabled after caching is no longer served from cache."""
+        executor = CommandExecutor()
+        assert executor.process_template("$(echo secret)", {})[0] == "secret"
+
+        executor.security_validator.disabled_commands.append("echo")
+        assert executor.is_command_allowed("echo secret") is False
+        assert executor.process_template("$(echo secret)", {})[0] != "secret"
+
+    def test_intelligent_command_prefers_first_successful_alternative(self):
+        """Test concurrently run probes still report the first success in order."""
+        from aix.commands import IntelligentShellCommand
+
+        command = IntelligentShellCommand("false")
+        command.alternatives = [
+            ("ls /nonexistent-aix-path", "missing"),
+            ("echo first", "first probe"),
+            ("echo second", "second probe"),
+        ]
+
+        success, stdout, _ = command.execute()
+
+        assert success is True
+        assert stdout.startswith("first\n")
+        assert "(first probe)" in stdout
+
+    def test_git_alternatives_depend_on_error(self):
+        """Test git fallbacks are only offered outside a repository."""
+        from aix.commands import IntelligentShellCommand
+
+        command = IntelligentShellCommand("git status")
+
+        assert command._build_alternatives("error: unknown option") == []
+        alternatives = command._build_alternatives(
+            "fatal: Not a git repository (or any of the parent directories): .git"
+        )
+        assert [reason for _, reason in alternatives] == [
+            "finding git repositories",
+            "showing directory contents",
+        ]
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from aix.config import Config
+from aix.config import Config, get_config
 
 
 class TestConfig:
@@ -142,6 +142,20 @@ class TestConfig:
         assert config2.get("persistent_key") == "persistent_value"
         assert config2.get_api_key("persistent_provider") == "persistent_key"
 
+    def test_cached_config_is_isolated_and_reloaded(self, temp_storage_dir):
+        """Test cached config loads are independent copies refreshed on edits."""
+        config_path = temp_storage_dir / "config.json"
+        Config(config_path).set("shared", {"nested": 1})
+
+        # Mutating one instance's settings does not leak into the next load
+        config1 = Config(config_path)
+        config1.get("shared")["nested"] = 2
+        assert Config(config_path).get("shared") == {"nested": 1}
+
+        # Edits made outside Config are picked up
+        config_path.write_text(json.dumps({"shared": {"nested": 3, "extra": True}}))
+        assert Config(config_path).get("shared") == {"nested": 3, "extra": True}
+
     def test_config_file_content(self, temp_storage_dir):
         """Test that config file contains expected structure."""
         config_path = temp_storage_dir / "config.json"
@@ -307,3 +321,25 @@ class TestCustomProviders:
         assert "provider1" in providers
         assert "provider2" not in providers
         assert "provider3" in providers
+
+    def test_update_disabled_commands(self, temp_storage_dir):
+        """Test batched disabled command changes are saved together."""
+        config_path = temp_storage_dir / "config.json"
+        config = Config(config_path)
+        config.set_disabled_commands(["rm", "dd"])
+
+        assert config.update_disabled_commands(add=["curl", "rm"], remove=["dd"])
+        assert config.get_disabled_commands() == ["rm", "curl"]
+        assert Config(config_path).get_disabled_commands() == ["rm", "curl"]
+
+    def test_get_config_shared_until_file_changes(self, temp_storage_dir):
+        """Test get_config reuses one instance until config.json changes."""
+        config_path = temp_storage_dir / "config.json"
+
+        config = get_config(config_path)
+        assert get_config(config_path) is config
+
+        config.set("editor", "vim")
+        refreshed = get_config(config_path)
+        assert refreshed is not config
+        assert refreshed.get("editor") == "vim"
@@ -85,6 +85,59 @@ class TestPromptStorage:
         assert "prompt2" in names
         assert "prompt3" in names
 
+    def test_save_prompt_with_cdata_terminator(self, temp_storage_dir):
+        """Test that content containing ']]>' survives a save and load."""
+        storage = PromptStorage(temp_storage_dir)
+
+        content = "if a[b[0]]>1: print('<done> & {name}')"
+        storage.save_prompt(PromptTemplate("cdata-edge", content))
+
+        loaded = storage.get_prompt("cdata-edge")
+        assert loaded is not None
+        assert loaded.template == content
+
+    def test_save_prompts_batch(self, temp_storage_dir):
+        """Test saving several prompts into a collection at once."""
+        storage = PromptStorage(temp_storage_dir)
+
+        prompts = [
+            PromptTemplate("batch1", "First {item}"),
+            PromptTemplate("batch2", "Second {item}"),
+        ]
+        success = storage.save_prompts_batch(prompts, "batch-collection")
+        assert success is True
+
+        for prompt in prompts:
+            loaded = storage.get_prompt(prompt.name, "batch-collection")
+            assert loaded is not None
+            assert loaded.template == prompt.template
+
+        # Saving the same names again adds nothing new
+        assert storage.save_prompts_batch(prompts, "batch-collection") is False
+
+    def test_list_prompt_names(self, temp_storage_dir):
+        """Test listing template names across collections."""
+        storage = PromptStorage(temp_storage_dir)
+
+        storage.save_prompt(PromptTemplate("name1", "Template 1"))
+        storage.save_prompt(PromptTemplate("name2", "Template 2"), "other")
+
+        assert storage.list_prompt_names() == {"name1", "name2"}
+
+    def test_list_prompt_names_is_read_only(self, temp_storage_dir, capsys):
+        """Test that listing names neither migrates collections nor writes files."""
+        storage = PromptStorage(temp_storage_dir)
+        storage.save_prompt(PromptTemplate("name1", "Template 1"))
+
+        legacy_dir = storage.collections_path / "legacy"
+        legacy_dir.mkdir()
+        (legacy_dir / "old.xml").write_text("<template/>")
+        before = sorted(p.name for p in storage.storage_path.rglob("*"))
+
+        assert storage.list_prompt_names() == {"name1"}
+        assert sorted(p.name for p in storage.storage_path.rglob("*")) == before
+        assert capsys.readouterr().out == ""
+
     def test_prompt_exists(self, temp_storage_dir):
         """Test checking if a prompt exists."""
         storage = PromptStorage(temp_storage_dir)